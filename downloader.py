@@ -277,7 +277,9 @@ ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
 
 def _strip_ansi(text: str) -> str:
     """Remove ANSI escape codes from strings."""
-    return ANSI_ESCAPE.sub("", text or "")
+    if not text or "\x1b" not in text:
+        return text or ""
+    return ANSI_ESCAPE.sub("", text)
 
 
 def _classify_error(message: str) -> ErrorCode:
@@ -6,8 +6,6 @@ import re
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-import yt_dlp
-
 from .base import BaseConverter, ContentType, ExtractorType, PluginCapabilities
 
 
@@ -55,6 +53,8 @@ class DailymotionConverter(BaseConverter):
     def get_info(self, url: str, **kwargs) -> Dict[str, Any]:
         """Extract metadata from Dailymotion URL"""
         try:
+            import yt_dlp
+
             ydl_opts = {
                 "quiet": True,
                 "no_warnings": True,
@@ -90,6 +90,8 @@ class DailymotionConverter(BaseConverter):
     ) -> Tuple[bool, Optional[str], Optional[str]]:
         """Download and convert Dailymotion content"""
         try:
+            import yt_dlp
+
             Path(output_path).mkdir(parents=True, exist_ok=True)
             filename_template = kwargs.get("filename_template", "%(title)s.%(ext)s")
             outtmpl = str(Path(output_path) / filename_template)
@@ -6,8 +6,6 @@ import re
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-import yt_dlp
-
 from .base import BaseConverter, ContentType, ExtractorType, PluginCapabilities
 
 
@@ -56,6 +54,8 @@ class RedditConverter(BaseConverter):
     def get_info(self, url: str, **kwargs) -> Dict[str, Any]:
         """Extract metadata from Reddit URL"""
         try:
+            import yt_dlp
+
             ydl_opts = {
                 "quiet": True,
                 "no_warnings": True,
@@ -88,6 +88,8 @@ class RedditConverter(BaseConverter):
     ) -> Tuple[bool, Optional[str], Optional[str]]:
         """Download and convert Reddit content"""
         try:
+            import yt_dlp
+
             Path(output_path).mkdir(parents=True, exist_ok=True)
             filename_template = kwargs.get("filename_template", "%(title)s.%(ext)s")
             outtmpl = str(Path(output_path) / filename_template)
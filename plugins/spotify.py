@@ -8,8 +8,6 @@ import re
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-import yt_dlp
-
 from .base import BaseConverter, ContentType, ExtractorType, PluginCapabilities
 
 
@@ -60,6 +58,8 @@ class SpotifyConverter(BaseConverter):
     def get_info(self, url: str, **kwargs) -> Dict[str, Any]:
         """Extract metadata from Spotify URL"""
         try:
+            import yt_dlp
+
             ydl_opts = {
                 "quiet": True,
                 "no_warnings": True,
@@ -96,6 +96,8 @@ class SpotifyConverter(BaseConverter):
         Note: Direct download requires authentication or finding equivalent tracks on YouTube.
         """
         try:
+            import yt_dlp
+
             Path(output_path).mkdir(parents=True, exist_ok=True)
             filename_template = kwargs.get("filename_template", "%(title)s.%(ext)s")
             outtmpl = str(Path(output_path) / filename_template)
@@ -2,17 +2,41 @@
 YouTube converter plugin - wrapper around yt-dlp's native YouTube support.
 """
 
+import functools
+import os
+import queue
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import yt_dlp
-from yt_dlp.utils import DownloadError
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 from .base import BaseConverter, ContentType, ExtractorType, PluginCapabilities
 
+if TYPE_CHECKING:
+    import yt_dlp
+
+# yt_dlp is imported inside the methods that need it: loading its extractors
+# is slow, and URL matching (can_handle/validate_url) never touches it.
+
 ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
 
+_FORBIDDEN_RE = re.compile(
+    r"http error 403|403: forbidden|unable to download video data"
+    r"|http error.*forbidden|forbidden.*http error",
+    re.IGNORECASE | re.DOTALL,
+)
+
 FALLBACK_HTTP_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -22,39 +46,178 @@ FALLBACK_HTTP_HEADERS = {
     "Referer": "https://www.youtube.com/",
 }
 
+# Options layered onto ydl_opts when YouTube answers with HTTP 403
+FALLBACK_YDL_OPTS = {
+    "extractor_args": {"youtube": {"player_client": ["android", "web"]}},
+    "http_headers": FALLBACK_HTTP_HEADERS,
+}
+
+# Static yt-dlp options shared by every download; per-call values are layered on top
+_BASE_YDL_OPTS = MappingProxyType(
+    {
+        "format": "bestaudio/best",
+        "continuedl": True,
+    }
+)
+
+# Quality preset -> FFmpegExtractAudio preferredquality ("0" is best VBR)
+_BITRATES = MappingProxyType(
+    {
+        "low": "128",
+        "medium": "192",
+        "high": "320",
+        "best": "0",
+    }
+)
+
+# download() kwargs copied verbatim into yt-dlp options when truthy
+_OPT_MAP = {
+    "proxy": "proxy",
+    "cookies_file": "cookiefile",
+    "rate_limit": "ratelimit",
+    "archive_file": "download_archive",
+}
+
+SKIPPED_MESSAGE = "Skipped: no new files downloaded (already exists or in archive)."
+
 
 def _strip_ansi(text: str) -> str:
     """Remove ANSI color codes from error strings for UI display and parsing."""
-    return ANSI_ESCAPE.sub("", text or "")
+    # Most messages carry no escapes; skip the regex engine for those
+    if not text or "\x1b" not in text:
+        return text or ""
+    return ANSI_ESCAPE.sub("", text)
 
 
 def _is_forbidden_error(message: str) -> bool:
     """Detect YouTube 403 blocks that benefit from fallback settings."""
-    msg = (message or "").lower()
-    return (
-        "http error 403" in msg
-        or "403: forbidden" in msg
-        or "unable to download video data" in msg
-        or ("http error" in msg and "forbidden" in msg)
-    )
+    return bool(message) and _FORBIDDEN_RE.search(message) is not None
+
+
+def _http_status(exc: Optional[BaseException]) -> Optional[int]:
+    """Return the HTTP status code behind a yt-dlp error, if it carries one."""
+    # DownloadError wraps the original in exc_info, ExtractorError in cause
+    for _ in range(5):
+        if exc is None:
+            return None
+        status = getattr(exc, "status", None) or getattr(exc, "code", None)
+        if isinstance(status, int):
+            return status
+        exc_info = getattr(exc, "exc_info", None)
+        exc = (
+            (exc_info[1] if exc_info else None)
+            or getattr(exc, "cause", None)
+            or exc.__cause__
+        )
+    return None
+
+
+def _is_forbidden_exc(exc: BaseException, message: str) -> bool:
+    """Detect a 403 from the wrapped HTTP error, else from ``message``."""
+    status = _http_status(exc)
+    if status is not None:
+        return status == 403
+    # Older yt-dlp versions and extractor errors only describe it in text
+    return _is_forbidden_error(message)
+
+
+@functools.lru_cache(maxsize=128)
+def _ensure_dir(path: str) -> str:
+    """Create ``path`` once per process; repeat calls for a batch are free."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _discard_files(paths: Iterable[Optional[str]]) -> None:
+    """Best-effort removal of leftover raw or partially converted files."""
+    for path in paths:
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
 
 def _merge_ydl_opts(base: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
     """Merge nested yt-dlp options (headers/extractor_args) safely."""
-    merged = dict(base)
-    for key, value in extra.items():
-        if key in ("extractor_args", "http_headers") and isinstance(
-            value, dict
-        ) and isinstance(merged.get(key), dict):
-            merged[key] = {**merged[key], **value}
-        else:
-            merged[key] = value
+    merged = {**base, **extra}
+    # Only these keys hold nested dicts that must be combined, not replaced
+    for key in ("extractor_args", "http_headers"):
+        if key in base and key in extra:
+            merged[key] = {**base[key], **extra[key]}
     return merged
 
 
+class _YdlSession:
+    """Per-thread YoutubeDL instances reused across one playlist batch.
+
+    Each instance loads the extractor registry once and keeps yt-dlp's HTTP
+    connection pool to the YouTube CDNs warm between tracks.
+    """
+
+    def __init__(self, ydl_opts: Dict[str, Any]):
+        self._opts = ydl_opts
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._instances: List["yt_dlp.YoutubeDL"] = []
+
+    def get(
+        self, hooks: List[Callable[[Dict[str, Any]], None]], fallback: bool = False
+    ) -> "yt_dlp.YoutubeDL":
+        """Return this thread's instance with progress events routed to ``hooks``."""
+        cache = getattr(self._local, "cache", None)
+        if cache is None:
+            cache = self._local.cache = {}
+        if fallback not in cache:
+            import yt_dlp
+
+            active: List[Callable[[Dict[str, Any]], None]] = []
+
+            # Captures the list rather than the thread-local: fragment
+            # downloads may report progress from yt-dlp's own threads
+            def dispatch(d: Dict[str, Any]) -> None:
+                for hook in active:
+                    hook(d)
+
+            opts = (
+                _merge_ydl_opts(self._opts, FALLBACK_YDL_OPTS)
+                if fallback
+                else dict(self._opts)
+            )
+            opts["progress_hooks"] = [dispatch]
+            ydl = yt_dlp.YoutubeDL(opts)
+            with self._lock:
+                self._instances.append(ydl)
+            cache[fallback] = (ydl, active)
+
+        ydl, active = cache[fallback]
+        active[:] = hooks
+        return ydl
+
+    def close(self) -> None:
+        """Close every instance created during the batch."""
+        with self._lock:
+            instances, self._instances = self._instances, []
+        for ydl in instances:
+            ydl.close()
+
+
 class YouTubeConverter(BaseConverter):
     """YouTube audio and video downloader"""
 
+    # YoutubeDL is not reentrant; serialises use of the cached _ydl_for instances
+    _info_lock = threading.Lock()
+
+    def __init__(self):
+        super().__init__()
+        # Set after the first 403 so later downloads start on the fallback client
+        self._use_fallback_client = threading.Event()
+        # One alternation keeps url_patterns matching to a single regex dispatch
+        self._url_re = re.compile(
+            "|".join(f"(?:{p})" for p in self.capabilities.url_patterns),
+            re.IGNORECASE,
+        )
+
     def get_capabilities(self) -> PluginCapabilities:
         return PluginCapabilities(
             name="YouTube Converter",
@@ -85,51 +248,78 @@ class YouTubeConverter(BaseConverter):
 
     def can_handle(self, url: str) -> bool:
         """Check if URL is a YouTube URL"""
-        for pattern in self.capabilities.url_patterns:
-            if re.match(pattern, url, re.IGNORECASE):
-                return True
-        return False
+        # Registry lookups mostly see other platforms; reject those without regex
+        if "youtu" not in url.lower():  # youtube.com, youtu.be, music.youtube.com
+            return False
+        return self._url_re.match(url) is not None
 
     def validate_url(self, url: str) -> Tuple[bool, str]:
         """Validate YouTube URL format"""
         if not url:
             return False, "URL cannot be empty"
 
-        if self.can_handle(url):
+        if self._url_re.match(url):
             return True, ""
 
         return False, f"Invalid YouTube URL format: {url}"
 
     def get_info(self, url: str, **kwargs) -> Dict[str, Any]:
-        """Extract metadata from YouTube URL"""
-        try:
-            ydl_opts = {
-                "quiet": True,
-                "no_warnings": True,
-                "noplaylist": not kwargs.get("is_playlist", False),
-            }
+        """Extract metadata from YouTube URL
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        Playlist entries come back as flat ``{id, url, title}`` stubs unless
+        ``flat=False`` is passed, which resolves every video individually.
+        ``entries`` is always a list (or None for single videos).
+        """
+        try:
+            flat = kwargs.get("flat", True)
+            ydl = self._ydl_for(kwargs.get("is_playlist", False), flat)
+            # Processing stays on so url/url_transparent stubs are resolved;
+            # extract_flat="in_playlist" already avoids probing every video
+            with self._info_lock:
                 info = ydl.extract_info(url, download=False)
-
-                return {
-                    "title": info.get("title", "Unknown"),
-                    "duration": info.get("duration", 0),
-                    "thumbnail": info.get("thumbnail", None),
-                    "uploader": info.get("uploader", "Unknown"),
-                    "description": info.get("description", ""),
-                    "view_count": info.get("view_count", 0),
-                    "like_count": info.get("like_count", 0),
-                    "upload_date": info.get("upload_date", ""),
-                    "is_playlist": "entries" in info,
-                    "video_count": (
-                        len(info.get("entries", [])) if "entries" in info else 1
-                    ),
-                    "entries": info.get("entries"),
-                }
+                entries = info.get("entries")
+                if entries is not None and not isinstance(entries, list):
+                    # Callers may index, len() or re-iterate cached results
+                    entries = list(entries)
+            video_count = info.get("playlist_count") or info.get("n_entries")
+            if video_count is None:
+                video_count = len(entries) if entries is not None else 1
+
+            thumbnail = info.get("thumbnail")
+            if not thumbnail and info.get("thumbnails"):
+                thumbnail = info["thumbnails"][-1].get("url")
+
+            return {
+                "title": info.get("title", "Unknown"),
+                "duration": info.get("duration", 0),
+                "thumbnail": thumbnail,
+                "uploader": info.get("uploader", "Unknown"),
+                "description": info.get("description", ""),
+                "view_count": info.get("view_count", 0),
+                "like_count": info.get("like_count", 0),
+                "upload_date": info.get("upload_date", ""),
+                "is_playlist": "entries" in info,
+                "video_count": video_count,
+                "entries": entries,
+            }
         except Exception as e:
             raise RuntimeError(f"Failed to extract YouTube info: {e}")
 
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def _ydl_for(cls, playlist: bool, flat: bool = True) -> "yt_dlp.YoutubeDL":
+        """Long-lived metadata-only YoutubeDL, one per playlist/flat mode."""
+        import yt_dlp
+
+        return yt_dlp.YoutubeDL(
+            {
+                "quiet": True,
+                "no_warnings": True,
+                "noplaylist": not playlist,
+                "extract_flat": "in_playlist" if flat else False,
+            }
+        )
+
     def download(
         self,
         url: str,
@@ -140,18 +330,11 @@ class YouTubeConverter(BaseConverter):
     ) -> Tuple[bool, Optional[str], Optional[str]]:
         """Download and convert YouTube content"""
         try:
-            Path(output_path).mkdir(parents=True, exist_ok=True)
+            _ensure_dir(output_path)
             filename_template = kwargs.get("filename_template", "%(title)s.%(ext)s")
             outtmpl = str(Path(output_path) / filename_template)
 
-            # Quality bitrates
-            bitrates = {
-                "low": "128",
-                "medium": "192",
-                "high": "320",
-                "best": "0",
-            }
-            bitrate = bitrates.get(quality, "192")
+            bitrate = _BITRATES.get(quality, "192")
 
             postprocessors = [
                 {
@@ -173,25 +356,20 @@ class YouTubeConverter(BaseConverter):
             cancel_event = kwargs.get("cancel_event")
 
             ydl_opts: Dict[str, Any] = {
-                "format": "bestaudio/best",
+                **_BASE_YDL_OPTS,
                 "postprocessors": postprocessors,
                 "outtmpl": outtmpl,
                 "quiet": kwargs.get("quiet", False),
                 "no_warnings": kwargs.get("quiet", False),
                 "writethumbnail": kwargs.get("embed_thumbnail", True),
                 "noplaylist": not kwargs.get("is_playlist", False),
-                "continuedl": True,
             }
 
             # Add optional parameters
-            if kwargs.get("proxy"):
-                ydl_opts["proxy"] = kwargs["proxy"]
-            if kwargs.get("cookies_file"):
-                ydl_opts["cookiefile"] = kwargs["cookies_file"]
-            if kwargs.get("rate_limit"):
-                ydl_opts["ratelimit"] = kwargs["rate_limit"]
-            if kwargs.get("archive_file"):
-                ydl_opts["download_archive"] = kwargs["archive_file"]
+            for kwarg, ydl_key in _OPT_MAP.items():
+                value = kwargs.get(kwarg)
+                if value:
+                    ydl_opts[ydl_key] = value
             if kwargs.get("skip_existing"):
                 ydl_opts["nooverwrites"] = True
 
@@ -204,66 +382,377 @@ class YouTubeConverter(BaseConverter):
                 ydl_opts["retries"] = retries
                 ydl_opts["fragment_retries"] = retries
 
-            downloaded_file = None
-            any_downloaded = False
-
-            class ProgressHook:
-                def __call__(self, d):
-                    nonlocal downloaded_file
-                    nonlocal any_downloaded
-                    if cancel_event and cancel_event.is_set():
-                        raise DownloadError("Download cancelled by user")
-                    if d["status"] == "finished":
-                        downloaded_file = d.get("filename")
-                        any_downloaded = True
+            # DASH/HLS streams are sharded; fetch several fragments at once
+            try:
+                fragments = max(1, int(kwargs.get("concurrent_fragments", 4)))
+            except (TypeError, ValueError):
+                fragments = 4
+            ydl_opts["concurrent_fragment_downloads"] = fragments
+
+            if kwargs.get("is_playlist"):
+                return self._download_playlist(
+                    url,
+                    ydl_opts,
+                    cancel_event,
+                    progress_hook,
+                    concurrent_downloads=kwargs.get("concurrent_downloads"),
+                    playlist_progress=kwargs.get("playlist_progress_callback"),
+                    downloaded_files=kwargs.get("downloaded_files"),
+                )
+            return self._download_one(url, ydl_opts, cancel_event, progress_hook)
 
-            hooks = [ProgressHook()]
-            if progress_hook:
-                hooks.append(progress_hook)
-            ydl_opts["progress_hooks"] = hooks
+        except Exception as e:
+            return False, None, f"YouTube download failed: {_strip_ansi(str(e))}"
 
-            try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
-                if not any_downloaded:
+    def _download_one(
+        self,
+        url: str,
+        ydl_opts: Dict[str, Any],
+        cancel_event: Optional[Any] = None,
+        progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_finished: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        session: Optional["_YdlSession"] = None,
+        extra_info: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Download a single URL, retrying once with fallback settings on 403.
+
+        ``on_finished`` is called with the downloaded file and its info dict
+        once yt-dlp returns, which lets callers post-process it elsewhere.
+        With a ``session`` the calling thread's YoutubeDL is reused instead of
+        building one from ``ydl_opts``. ``extra_info`` fields (e.g. the
+        ``playlist_*`` context of a playlist entry) are added to the info
+        dict, so output templates and progress hooks can use them.
+        """
+        import yt_dlp
+        from yt_dlp.utils import DownloadError
+
+        downloaded_file = None
+        downloaded_info: Dict[str, Any] = {}
+        any_downloaded = False
+
+        # yt-dlp calls this for every chunk, so keep it a plain closure
+        is_cancelled = cancel_event.is_set if cancel_event is not None else None
+
+        def track_progress(d: Dict[str, Any]) -> None:
+            nonlocal downloaded_file, downloaded_info, any_downloaded
+            if is_cancelled is not None and is_cancelled():
+                raise DownloadError("Download cancelled by user")
+            if d["status"] == "finished":
+                downloaded_file = d.get("filename")
+                downloaded_info = d.get("info_dict") or {}
+                any_downloaded = True
+
+        def finished() -> Tuple[bool, Optional[str], Optional[str]]:
+            if not any_downloaded:
+                return False, None, SKIPPED_MESSAGE
+            if on_finished:
+                if not downloaded_file:
+                    # Nothing to hand on, so the caller must finish it as failed
                     return (
                         False,
                         None,
-                        "Skipped: no new files downloaded (already exists or in archive).",
+                        "YouTube download failed: yt-dlp reported no output file",
                     )
-                return True, downloaded_file, None
-            except Exception as e:
-                error_message = _strip_ansi(str(e))
-                if _is_forbidden_error(error_message):
-                    fallback_opts = _merge_ydl_opts(
-                        ydl_opts,
-                        {
-                            "extractor_args": {
-                                "youtube": {"player_client": ["android", "web"]}
-                            },
-                            "http_headers": FALLBACK_HTTP_HEADERS,
-                        },
-                    )
-                    try:
-                        with yt_dlp.YoutubeDL(fallback_opts) as ydl:
-                            ydl.download([url])
-                        if not any_downloaded:
-                            return (
-                                False,
-                                None,
-                                "Skipped: no new files downloaded (already exists or in archive).",
-                            )
-                        return True, downloaded_file, None
-                    except Exception as fallback_error:
-                        fallback_message = _strip_ansi(str(fallback_error))
-                        hint = (
-                            "Hint: YouTube blocked the request (HTTP 403). "
-                            "Try providing a cookies file or updating yt-dlp."
-                        )
-                        if _is_forbidden_error(fallback_message):
-                            fallback_message = f"{fallback_message} ({hint})"
-                        return False, None, f"YouTube download failed: {fallback_message}"
-                return False, None, f"YouTube download failed: {error_message}"
+                on_finished(downloaded_file, downloaded_info)
+            return True, downloaded_file, None
+
+        hooks = [track_progress]
+        if progress_hook:
+            hooks.append(progress_hook)
+        # Each call gets its own hook list so concurrent workers never share state
+        ydl_opts = dict(ydl_opts, progress_hooks=hooks)
+        using_fallback = self._use_fallback_client.is_set()
+
+        def fetch(ydl: "yt_dlp.YoutubeDL") -> None:
+            if extra_info:
+                ydl.extract_info(url, download=True, extra_info=extra_info)
+            else:
+                ydl.download([url])
+
+        def run(fallback: bool) -> None:
+            if session is not None:
+                fetch(session.get(hooks, fallback))
+                return
+            opts = _merge_ydl_opts(ydl_opts, FALLBACK_YDL_OPTS) if fallback else ydl_opts
+            with yt_dlp.YoutubeDL(opts) as ydl:
+                fetch(ydl)
 
+        try:
+            run(using_fallback)
+            return finished()
+        except DownloadError as e:
+            # Only yt-dlp errors carry ANSI colour and can be a 403 worth retrying
+            error_message = _strip_ansi(str(e))
+            forbidden = _is_forbidden_exc(e, error_message)
+            if forbidden and not using_fallback:
+                # Once YouTube blocks us, skip the doomed default client from now on
+                self._use_fallback_client.set()
+                try:
+                    run(True)
+                    return finished()
+                except DownloadError as fallback_error:
+                    error_message = _strip_ansi(str(fallback_error))
+                    forbidden = _is_forbidden_exc(fallback_error, error_message)
+                except Exception as fallback_error:
+                    return False, None, f"YouTube download failed: {fallback_error}"
+            if forbidden:
+                hint = (
+                    "Hint: YouTube blocked the request (HTTP 403). "
+                    "Try providing a cookies file or updating yt-dlp."
+                )
+                error_message = f"{error_message} ({hint})"
+            return False, None, f"YouTube download failed: {error_message}"
         except Exception as e:
-            return False, None, f"YouTube download failed: {_strip_ansi(str(e))}"
+            return False, None, f"YouTube download failed: {e}"
+
+    def _download_playlist(
+        self,
+        url: str,
+        ydl_opts: Dict[str, Any],
+        cancel_event: Optional[Any] = None,
+        progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None,
+        concurrent_downloads: Optional[int] = None,
+        playlist_progress: Optional[Callable[[int, int, str], None]] = None,
+        downloaded_files: Optional[List[str]] = None,
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Download playlist entries concurrently, one YoutubeDL per worker thread.
+
+        Downloads and ffmpeg postprocessing run on separate thread pools joined
+        by a queue, so conversion of one track overlaps the next track's fetch.
+
+        Cancellation is cooperative: downloads stop at their next progress
+        tick, queued conversions are discarded, and a conversion already
+        running is allowed to finish (and be archived). Every worker thread is
+        joined before this returns, so callers should wait for it rather than
+        kill the process, which could leave a half-written file behind.
+        """
+        import yt_dlp
+
+        list_opts = {"quiet": True, "no_warnings": True, "extract_flat": "in_playlist"}
+        for key in ("proxy", "cookiefile"):
+            if key in ydl_opts:
+                list_opts[key] = ydl_opts[key]
+
+        with yt_dlp.YoutubeDL(list_opts) as ydl:
+            info = ydl.extract_info(url, download=False) or {}
+
+        if "entries" not in info:
+            return self._download_one(url, ydl_opts, cancel_event, progress_hook)
+
+        listed = list(info.get("entries") or [])
+        positions, raw_entries = [], []
+        for position, entry in enumerate(listed, 1):
+            if entry and (entry.get("url") or entry.get("webpage_url")):
+                positions.append(position)
+                raw_entries.append(entry)
+        if not raw_entries:
+            return False, None, SKIPPED_MESSAGE
+        entries = [
+            (entry.get("url") or entry.get("webpage_url"), entry.get("title") or "")
+            for entry in raw_entries
+        ]
+
+        # Entries are fetched by their own URL, so hand each one the playlist
+        # context yt-dlp would otherwise add (%(playlist_index)s and friends)
+        playlist_info = {
+            "playlist": info.get("title") or info.get("id"),
+            "playlist_id": info.get("id"),
+            "playlist_title": info.get("title"),
+            "playlist_uploader": info.get("uploader"),
+            "playlist_uploader_id": info.get("uploader_id"),
+            "playlist_count": info.get("playlist_count") or len(listed),
+            "n_entries": len(listed),
+        }
+        extras = [
+            dict(playlist_info, playlist_index=position, playlist_autonumber=number)
+            for number, position in enumerate(positions, 1)
+        ]
+
+        # Entries are only archived once converted (see _pp_worker), so the
+        # fetch side can't consult the archive; filter already-archived ones here
+        archived = [False] * len(raw_entries)
+        if ydl_opts.get("download_archive"):
+            with yt_dlp.YoutubeDL(
+                {
+                    "quiet": True,
+                    "no_warnings": True,
+                    "download_archive": ydl_opts["download_archive"],
+                }
+            ) as archive_ydl:
+                archived = [archive_ydl.in_download_archive(e) for e in raw_entries]
+
+        try:
+            workers = max(1, int(concurrent_downloads or 4))
+        except (TypeError, ValueError):
+            workers = 4
+
+        # Network side fetches raw audio only; ffmpeg runs on the consumer threads
+        fetch_opts = dict(ydl_opts, noplaylist=True, postprocessors=[], keepvideo=True)
+        fetch_opts.pop("download_archive", None)
+        postprocessors = ydl_opts.get("postprocessors") or []
+        total = len(entries)
+        results: List[Optional[Tuple[bool, Optional[str], Optional[str]]]] = [
+            None
+        ] * total
+        results_lock = threading.Lock()
+        completed = 0
+        cancelled = False
+
+        def finish(index: int, result: Tuple[bool, Optional[str], Optional[str]]):
+            nonlocal completed
+            with results_lock:
+                results[index] = result
+                completed += 1
+                done = completed
+            if playlist_progress:
+                playlist_progress(done, total, entries[index][1])
+
+        pp_queue: "queue.Queue[Optional[Tuple[int, str, Dict[str, Any]]]]" = (
+            queue.Queue()
+        )
+        # Not daemon threads, and always joined below: an in-flight conversion
+        # finishes instead of leaving a half-written file behind
+        pp_threads = [
+            threading.Thread(
+                target=self._pp_worker,
+                args=(pp_queue, postprocessors, ydl_opts, finish, cancel_event),
+            )
+            for _ in range(max(1, (os.cpu_count() or 2) // 2))
+        ]
+        for thread in pp_threads:
+            thread.start()
+        session = _YdlSession(fetch_opts)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, total)) as executor:
+                futures = {
+                    executor.submit(
+                        self._download_one,
+                        entry_url,
+                        fetch_opts,
+                        cancel_event,
+                        progress_hook,
+                        lambda filename, info, index=index: pp_queue.put(
+                            (index, filename, info)
+                        ),
+                        session,
+                        extras[index],
+                    ): index
+                    for index, (entry_url, _title) in enumerate(entries)
+                    if not archived[index]
+                }
+                for index, is_archived in enumerate(archived):
+                    if is_archived:
+                        finish(index, (False, None, SKIPPED_MESSAGE))
+                for future in as_completed(futures):
+                    if cancel_event and cancel_event.is_set() and not cancelled:
+                        cancelled = True
+                        # Drop queued entries; running ones stop via the progress hook
+                        for pending in futures:
+                            pending.cancel()
+                    if future.cancelled():
+                        continue
+                    result = future.result()
+                    if not result[0]:
+                        # Successful downloads are finished by the postprocessing side
+                        finish(futures[future], result)
+        finally:
+            session.close()
+            for _ in pp_threads:
+                pp_queue.put(None)
+            for thread in pp_threads:
+                thread.join()
+
+        if cancelled:
+            return False, None, "Download cancelled by user"
+
+        files = [r[1] for r in results if r and r[0] and r[1]]
+        failures = [
+            r[2] for r in results if r and not r[0] and r[2] != SKIPPED_MESSAGE
+        ]
+        if isinstance(downloaded_files, list):
+            downloaded_files.extend(files)
+
+        if failures:
+            return (
+                False,
+                None,
+                f"{len(failures)} of {total} playlist entries failed: {failures[0]}",
+            )
+        if not files:
+            return False, None, SKIPPED_MESSAGE
+        return True, files[-1], None
+
+    def _pp_worker(
+        self,
+        pp_queue: "queue.Queue[Optional[Tuple[int, str, Dict[str, Any]]]]",
+        postprocessors: List[Dict[str, Any]],
+        ydl_opts: Dict[str, Any],
+        finish: Callable[[int, Tuple[bool, Optional[str], Optional[str]]], None],
+        cancel_event: Optional[Any] = None,
+    ) -> None:
+        """Consume raw downloads from ``pp_queue`` until a ``None`` sentinel.
+
+        An entry is recorded in the download archive only after every
+        postprocessor succeeded; on failure or cancellation its raw download
+        and any partial output are removed so a later run retries it.
+        """
+        import yt_dlp
+        from yt_dlp.postprocessor import get_postprocessor
+
+        pp_opts = {
+            "quiet": ydl_opts.get("quiet", False),
+            "no_warnings": ydl_opts.get("no_warnings", False),
+        }
+        if ydl_opts.get("download_archive"):
+            pp_opts["download_archive"] = ydl_opts["download_archive"]
+        stem = os.path.splitext
+        codecs = [
+            spec["preferredcodec"]
+            for spec in postprocessors
+            if spec.get("preferredcodec")
+        ]
+        with yt_dlp.YoutubeDL(pp_opts) as ydl:
+            pps = None
+            while True:
+                item = pp_queue.get()
+                if item is None:
+                    return
+                index, filename, info = item
+                # Raw download, converted outputs and written thumbnails; files
+                # that were already there before conversion are never removed
+                outputs = [f"{stem(filename)[0]}.{codec}" for codec in codecs]
+                keep = {path for path in outputs if os.path.exists(path)} - {filename}
+                leftovers = [filename, *outputs]
+                leftovers.extend(
+                    thumb.get("filepath") for thumb in info.get("thumbnails") or ()
+                )
+                if cancel_event and cancel_event.is_set():
+                    _discard_files(path for path in leftovers if path not in keep)
+                    finish(index, (False, None, "Download cancelled by user"))
+                    continue
+                try:
+                    if pps is None:
+                        pps = [
+                            get_postprocessor(spec["key"])(
+                                ydl, **{k: v for k, v in spec.items() if k != "key"}
+                            )
+                            for spec in postprocessors
+                        ]
+                    info = dict(info, filepath=filename)
+                    for pp in pps:
+                        info = ydl.run_pp(pp, info)
+                        leftovers.append(info.get("filepath"))
+                    if pp_opts.get("download_archive"):
+                        ydl.record_download_archive(info)
+                    finish(index, (True, info.get("filepath") or filename, None))
+                except Exception as e:
+                    _discard_files(path for path in leftovers if path not in keep)
+                    finish(
+                        index,
+                        (
+                            False,
+                            None,
+                            f"YouTube post-processing failed: {_strip_ansi(str(e))}",
+                        ),
+                    )
@@ -0,0 +1,151 @@
+"""
+Tests for the Tkinter GUI helpers that run without a display
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tubetracks_gui import App
+
+
+class FakeVar:
+    """Stand-in for a Tk variable; needs no Tk root"""
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+
+    def get(self):
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def downloading(filename, percent, playlist_index=None):
+    payload = {"status": "downloading", "filename": filename, "_percent_str": percent}
+    if playlist_index is not None:
+        payload["info_dict"] = {"playlist_index": playlist_index}
+    return {"type": "progress", "payload": payload}
+
+
+class TestCoalesceMessages:
+    """Tests for how a drained worker batch is reduced before handling"""
+
+    def test_keeps_only_latest_status(self):
+        """Test superseded status texts are dropped"""
+        batch = [
+            {"type": "status", "text": "one"},
+            {"type": "status", "text": "two"},
+            {"type": "status", "text": "three"},
+        ]
+        assert App._coalesce_messages(batch) == [{"type": "status", "text": "three"}]
+
+    def test_keeps_latest_progress_per_file(self):
+        """Test each parallel download keeps its own newest progress tick"""
+        batch = [
+            downloading("a.webm", "10%"),
+            downloading("b.webm", "5%"),
+            downloading("a.webm", "20%"),
+            downloading("b.webm", "15%"),
+            downloading("a.webm", "30%"),
+        ]
+        kept = App._coalesce_messages(batch)
+        assert [m["payload"]["_percent_str"] for m in kept] == ["15%", "30%"]
+        assert [m["payload"]["filename"] for m in kept] == ["b.webm", "a.webm"]
+
+    def test_playlist_entries_are_kept_apart(self):
+        """Test progress for different playlist items is not merged"""
+        batch = [
+            downloading("x.webm", "50%", playlist_index=1),
+            downloading("x.webm", "10%", playlist_index=2),
+        ]
+        assert App._coalesce_messages(batch) == batch
+
+    def test_non_downloading_progress_is_never_dropped(self):
+        """Test finished/processing events survive even when repeated"""
+        finished = {"type": "progress", "payload": {"status": "finished"}}
+        processing = {"type": "progress", "payload": {"status": "processing"}}
+        batch = [finished, processing, finished]
+        assert App._coalesce_messages(batch) == batch
+
+    def test_results_and_done_are_never_dropped(self):
+        """Test every result is kept, in order, ahead of the final done"""
+        batch = [
+            {"type": "result", "url": "u1"},
+            {"type": "status", "text": "Completed 1/2"},
+            {"type": "result", "url": "u2"},
+            {"type": "status", "text": "Completed 2/2"},
+            {"type": "done"},
+        ]
+        assert App._coalesce_messages(batch) == [
+            {"type": "result", "url": "u1"},
+            {"type": "result", "url": "u2"},
+            {"type": "status", "text": "Completed 2/2"},
+            {"type": "done"},
+        ]
+
+    def test_preserves_order_across_types(self):
+        """Test logs, progress and results keep their relative order"""
+        batch = [
+            {"type": "log", "text": "→ u1"},
+            downloading("a.webm", "10%"),
+            {"type": "log", "text": "line"},
+            downloading("a.webm", "90%"),
+            {"type": "result", "url": "u1"},
+            {"type": "log", "text": "after"},
+            {"type": "cancelled"},
+        ]
+        kept = App._coalesce_messages(batch)
+        assert [m["type"] for m in kept] == [
+            "log",
+            "log",
+            "progress",
+            "result",
+            "log",
+            "cancelled",
+        ]
+        assert kept[2]["payload"]["_percent_str"] == "90%"
+
+    def test_empty_batch(self):
+        """Test an empty drain stays empty"""
+        assert App._coalesce_messages([]) == []
+
+
+class TestReadInt:
+    """Tests for clamped integer form fields"""
+
+    def test_value_in_range(self):
+        """Test valid values pass through without a warning"""
+        assert App._read_int(FakeVar(3), 1, 1, 5, "retries") == (3, None)
+
+    def test_value_below_range(self):
+        """Test values below the minimum are raised to it"""
+        value, warning = App._read_int(FakeVar(0), 3, 1, 5, "retries")
+        assert value == 1
+        assert "Retries must be >= 1" in warning
+
+    def test_value_above_range(self):
+        """Test values above the maximum are capped"""
+        value, warning = App._read_int(FakeVar(9), 3, 1, 5, "concurrent downloads")
+        assert value == 5
+        assert "Concurrent downloads capped at 5 (was 9)" in warning
+
+    def test_invalid_value_uses_default(self):
+        """Test unparsable text falls back to the default"""
+        value, warning = App._read_int(FakeVar("abc"), 3, 1, 5, "retries")
+        assert value == 3
+        assert "Invalid retries value, using default (3)" in warning
+
+    def test_tcl_error_uses_default(self):
+        """Test a Tk variable that fails to read falls back to the default"""
+        var = FakeVar(error=tk.TclError('expected integer but got ""'))
+        value, warning = App._read_int(var, 2, 1, 5, "retries")
+        assert value == 2
+        assert warning.startswith("⚠ Invalid retries value")
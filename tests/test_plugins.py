@@ -8,6 +8,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from yt_dlp import YoutubeDL as RealYoutubeDL
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -201,6 +202,413 @@ class TestYouTubeConverter:
         assert len(msg) > 0
 
 
+class TestYouTubeErrorHelpers:
+    """Tests for YouTube error message helpers"""
+
+    def test_forbidden_error_detection(self):
+        """Test 403 variants are recognised regardless of case"""
+        from plugins.youtube import _is_forbidden_error
+
+        assert _is_forbidden_error("ERROR: HTTP Error 403: Forbidden") is True
+        assert _is_forbidden_error("unable to download video data: oops") is True
+        assert _is_forbidden_error("HTTP Error 503\nserver says Forbidden") is True
+        assert _is_forbidden_error("Forbidden (HTTP Error 403)") is True
+        assert _is_forbidden_error("Forbidden\nwhile handling HTTP error") is True
+        assert _is_forbidden_error("HTTP Error 404: Not Found") is False
+        assert _is_forbidden_error("") is False
+        assert _is_forbidden_error(None) is False
+
+    def test_forbidden_detection_uses_wrapped_http_error(self):
+        """Test the HTTP status wrapped in a DownloadError wins over its text"""
+        from yt_dlp.networking.exceptions import HTTPError
+        from yt_dlp.utils import DownloadError
+
+        from plugins.youtube import _is_forbidden_exc
+
+        def wrapped(status, message):
+            response = MagicMock(status=status, reason="Reason")
+            cause = HTTPError(response)
+            return DownloadError(message, exc_info=(HTTPError, cause, None))
+
+        assert _is_forbidden_exc(wrapped(403, "ERROR: oops"), "ERROR: oops") is True
+        message = "ERROR: unable to download video data: HTTP Error 404"
+        assert _is_forbidden_exc(wrapped(404, message), message) is False
+        plain = DownloadError("ERROR: HTTP Error 403: Forbidden")
+        assert _is_forbidden_exc(plain, str(plain)) is True
+
+
+class TestYouTubeInfo:
+    """Tests for YouTube metadata extraction (yt-dlp mocked)"""
+
+    @pytest.fixture(autouse=True)
+    def clear_ydl_cache(self):
+        YouTubeConverter._ydl_for.cache_clear()
+        yield
+        YouTubeConverter._ydl_for.cache_clear()
+
+    def test_get_info_reuses_youtubedl(self):
+        """Test repeated metadata probes share one YoutubeDL instance"""
+        with patch("yt_dlp.YoutubeDL") as ydl_cls:
+            ydl_cls.return_value.extract_info.return_value = {
+                "title": "Test Video",
+                "duration": 42,
+                "thumbnails": [{"url": "https://i.ytimg.com/vi/x/default.jpg"}],
+            }
+            converter = YouTubeConverter()
+            converter.get_info("https://www.youtube.com/watch?v=x")
+            info = converter.get_info("https://www.youtube.com/watch?v=y")
+
+        assert ydl_cls.call_count == 1
+        assert ydl_cls.call_args[0][0]["extract_flat"] == "in_playlist"
+        # url/url_transparent results are only resolved when processing is on
+        assert ydl_cls.return_value.extract_info.call_args[1].get("process", True)
+        assert info["title"] == "Test Video"
+        assert info["thumbnail"] == "https://i.ytimg.com/vi/x/default.jpg"
+        assert info["video_count"] == 1
+
+    def test_get_info_full_playlist_resolution(self):
+        """Test flat=False processes entries instead of returning stubs"""
+        with patch("yt_dlp.YoutubeDL") as ydl_cls:
+            ydl_cls.return_value.extract_info.return_value = {
+                "title": "Playlist",
+                "entries": [{"title": "A"}, {"title": "B"}],
+            }
+            info = YouTubeConverter().get_info(
+                "https://www.youtube.com/playlist?list=PLtest",
+                is_playlist=True,
+                flat=False,
+            )
+
+        assert ydl_cls.call_args[0][0]["extract_flat"] is False
+        assert ydl_cls.return_value.extract_info.call_args[1].get("process", True)
+        assert info["is_playlist"] is True
+        assert info["video_count"] == 2
+
+    def test_get_info_materialises_lazy_entries(self):
+        """Test lazy playlist entries come back as a reusable list"""
+
+        def entries():
+            for title in ("A", "B", "C"):
+                yield {"title": title}
+
+        with patch("yt_dlp.YoutubeDL") as ydl_cls:
+            ydl_cls.return_value.extract_info.return_value = {
+                "title": "Playlist",
+                "playlist_count": 3,
+                "entries": entries(),
+            }
+            info = YouTubeConverter().get_info(
+                "https://www.youtube.com/playlist?list=PLtest", is_playlist=True
+            )
+
+        assert info["video_count"] == 3
+        assert isinstance(info["entries"], list)
+        assert [e["title"] for e in info["entries"]] == ["A", "B", "C"]
+        assert [e["title"] for e in info["entries"]] == ["A", "B", "C"]
+
+
+class FakeYoutubeDL:
+    """Minimal stand-in for yt_dlp.YoutubeDL used by download tests"""
+
+    playlist_entries = []
+    downloaded = []
+    instances = 0
+    archived = set()
+    recorded = []
+
+    def __init__(self, params=None):
+        self.params = params or {}
+        FakeYoutubeDL.instances += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def close(self):
+        pass
+
+    def extract_info(self, url, download=True, extra_info=None, **kwargs):
+        if download:
+            self._fetch(url, extra_info or {})
+            return {}
+        return {
+            "id": "PLtest",
+            "title": "Playlist",
+            "entries": list(self.playlist_entries),
+        }
+
+    def download(self, urls):
+        for url in urls:
+            self._fetch(url, {})
+
+    def _fetch(self, url, extra_info):
+        FakeYoutubeDL.downloaded.append(
+            (
+                url,
+                self.params.get("postprocessors"),
+                self.params.get("download_archive"),
+            )
+        )
+        info = {"id": url[-1], "title": url[-1].upper(), "ext": "webm", **extra_info}
+        for hook in self.params.get("progress_hooks", []):
+            hook(
+                {
+                    "status": "finished",
+                    "filename": self.filename_for(info),
+                    "info_dict": info,
+                }
+            )
+
+    def filename_for(self, info):
+        return f"{info['id']}.webm"
+
+    def run_pp(self, pp, info):
+        return dict(info, filepath=info["filepath"].rsplit(".", 1)[0] + ".mp3")
+
+    def in_download_archive(self, info):
+        return info.get("url") in self.archived
+
+    def record_download_archive(self, info):
+        FakeYoutubeDL.recorded.append(info["filepath"])
+
+
+class TestYouTubeDownload:
+    """Tests for YouTube download orchestration (yt-dlp mocked)"""
+
+    @pytest.fixture(autouse=True)
+    def fake_ydl(self):
+        FakeYoutubeDL.playlist_entries = [
+            {"url": "https://www.youtube.com/watch?v=a", "title": "A"},
+            {"url": "https://www.youtube.com/watch?v=b", "title": "B"},
+            {"url": "https://www.youtube.com/watch?v=c", "title": "C"},
+        ]
+        FakeYoutubeDL.downloaded = []
+        FakeYoutubeDL.instances = 0
+        FakeYoutubeDL.archived = set()
+        FakeYoutubeDL.recorded = []
+        with patch("yt_dlp.YoutubeDL", FakeYoutubeDL), patch(
+            "yt_dlp.postprocessor.get_postprocessor",
+            return_value=lambda ydl, **kwargs: MagicMock(),
+        ):
+            yield
+
+    def test_single_video_download(self, tmp_path):
+        """Test single URL downloads report the finished file"""
+        converter = YouTubeConverter()
+        success, path, error = converter.download(
+            "https://www.youtube.com/watch?v=x", str(tmp_path), quiet=True
+        )
+        assert success is True
+        assert path == "x.webm"
+        assert error is None
+
+    def test_forbidden_switches_to_fallback_client(self, tmp_path):
+        """Test a 403 retries with fallback settings and keeps using them"""
+        from yt_dlp.utils import DownloadError
+
+        attempts = []
+
+        class BlockedYoutubeDL(FakeYoutubeDL):
+            def download(self, urls):
+                attempts.append("http_headers" in self.params)
+                if "http_headers" not in self.params:
+                    raise DownloadError("ERROR: HTTP Error 403: Forbidden")
+                super().download(urls)
+
+        converter = YouTubeConverter()
+        with patch("yt_dlp.YoutubeDL", BlockedYoutubeDL):
+            first = converter.download(
+                "https://www.youtube.com/watch?v=x", str(tmp_path), quiet=True
+            )
+            second = converter.download(
+                "https://www.youtube.com/watch?v=y", str(tmp_path), quiet=True
+            )
+
+        assert first[0] is True
+        assert second[0] is True
+        assert attempts == [False, True, True]
+
+    def test_playlist_downloads_every_entry(self, tmp_path):
+        """Test playlist entries are dispatched individually to the pool"""
+        converter = YouTubeConverter()
+        files = []
+        progress = []
+        success, path, error = converter.download(
+            "https://www.youtube.com/playlist?list=PLtest",
+            str(tmp_path),
+            quiet=True,
+            is_playlist=True,
+            concurrent_downloads=2,
+            downloaded_files=files,
+            playlist_progress_callback=lambda c, t, title: progress.append((c, t)),
+        )
+        assert success is True
+        assert error is None
+        assert sorted(url for url, *_ in FakeYoutubeDL.downloaded) == [
+            "https://www.youtube.com/watch?v=a",
+            "https://www.youtube.com/watch?v=b",
+            "https://www.youtube.com/watch?v=c",
+        ]
+        # ffmpeg work is moved off the download threads
+        assert all(pps == [] for _, pps, _archive in FakeYoutubeDL.downloaded)
+        assert sorted(files) == ["a.mp3", "b.mp3", "c.mp3"]
+        assert progress[-1] == (3, 3)
+
+    def test_playlist_reuses_youtubedl_per_worker(self, tmp_path):
+        """Test playlist workers share one YoutubeDL instead of one per entry"""
+        converter = YouTubeConverter()
+        success, _path, _error = converter.download(
+            "https://www.youtube.com/playlist?list=PLtest",
+            str(tmp_path),
+            quiet=True,
+            is_playlist=True,
+            concurrent_downloads=1,
+        )
+        assert success is True
+        assert len(FakeYoutubeDL.downloaded) == 3
+        # listing + one download worker + one postprocessing worker
+        assert FakeYoutubeDL.instances == 2 + max(1, (os.cpu_count() or 2) // 2)
+
+    def test_playlist_archives_entries_after_conversion(self, tmp_path):
+        """Test archived entries are skipped and new ones recorded once converted"""
+        FakeYoutubeDL.archived = {"https://www.youtube.com/watch?v=a"}
+        converter = YouTubeConverter()
+        success, _path, _error = converter.download(
+            "https://www.youtube.com/playlist?list=PLtest",
+            str(tmp_path),
+            quiet=True,
+            is_playlist=True,
+            archive_file=str(tmp_path / "archive.txt"),
+        )
+        assert success is True
+        assert sorted(url for url, *_ in FakeYoutubeDL.downloaded) == [
+            "https://www.youtube.com/watch?v=b",
+            "https://www.youtube.com/watch?v=c",
+        ]
+        # the fetch side must not archive before ffmpeg has run
+        assert all(archive is None for *_, archive in FakeYoutubeDL.downloaded)
+        assert sorted(FakeYoutubeDL.recorded) == ["b.mp3", "c.mp3"]
+
+    def test_playlist_failed_conversion_is_not_archived(self, tmp_path, monkeypatch):
+        """Test a failed conversion removes the raw file and skips the archive"""
+        monkeypatch.chdir(tmp_path)
+
+        class BrokenPPYoutubeDL(FakeYoutubeDL):
+            def _fetch(self, url, extra_info):
+                Path(f"{url[-1]}.webm").write_bytes(b"raw")
+                super()._fetch(url, extra_info)
+
+            def run_pp(self, pp, info):
+                raise RuntimeError("ffmpeg exited with code 1")
+
+        converter = YouTubeConverter()
+        with patch("yt_dlp.YoutubeDL", BrokenPPYoutubeDL):
+            success, _path, error = converter.download(
+                "https://www.youtube.com/playlist?list=PLtest",
+                str(tmp_path),
+                quiet=True,
+                is_playlist=True,
+                archive_file=str(tmp_path / "archive.txt"),
+            )
+        assert success is False
+        assert "3 of 3 playlist entries failed" in error
+        assert FakeYoutubeDL.recorded == []
+        assert not list(tmp_path.glob("*.webm"))
+
+    def test_playlist_entry_without_file_still_finishes(self, tmp_path):
+        """Test an entry yt-dlp reports without a filename counts as failed"""
+
+        class NoFileYoutubeDL(FakeYoutubeDL):
+            def filename_for(self, info):
+                return None if info["id"] == "b" else super().filename_for(info)
+
+        progress = []
+        converter = YouTubeConverter()
+        with patch("yt_dlp.YoutubeDL", NoFileYoutubeDL):
+            success, path, error = converter.download(
+                "https://www.youtube.com/playlist?list=PLtest",
+                str(tmp_path),
+                quiet=True,
+                is_playlist=True,
+                playlist_progress_callback=lambda c, t, title: progress.append(c),
+            )
+        assert success is False
+        assert path is None
+        assert "1 of 3 playlist entries failed" in error
+        assert "no output file" in error
+        assert max(progress) == 3
+
+    def test_playlist_cancel_finishes_current_conversion_and_joins(self, tmp_path):
+        """Test cancel lets the running conversion finish, then joins every worker"""
+        import threading
+
+        cancel = threading.Event()
+
+        class CancellingYoutubeDL(FakeYoutubeDL):
+            def _fetch(self, url, extra_info):
+                if not url.endswith("a"):
+                    # later entries are still downloading when cancel arrives
+                    cancel.wait(5)
+                super()._fetch(url, extra_info)
+
+            def run_pp(self, pp, info):
+                cancel.set()
+                return super().run_pp(pp, info)
+
+        threads_before = threading.active_count()
+        converter = YouTubeConverter()
+        with patch("yt_dlp.YoutubeDL", CancellingYoutubeDL):
+            success, _path, error = converter.download(
+                "https://www.youtube.com/playlist?list=PLtest",
+                str(tmp_path),
+                quiet=True,
+                is_playlist=True,
+                concurrent_downloads=1,
+                cancel_event=cancel,
+                archive_file=str(tmp_path / "archive.txt"),
+            )
+        assert success is False
+        assert error == "Download cancelled by user"
+        # the conversion in flight completed and was archived; nothing else was
+        assert FakeYoutubeDL.recorded == ["a.mp3"]
+        assert threading.active_count() == threads_before
+
+    def test_playlist_entries_keep_playlist_fields(self, tmp_path):
+        """Test %(playlist_index)s and friends still render for playlist entries"""
+
+        class TemplatingYoutubeDL(FakeYoutubeDL):
+            def filename_for(self, info):
+                # Render the caller's template the way yt-dlp would
+                real = RealYoutubeDL({"outtmpl": self.params["outtmpl"], "quiet": True})
+                return real.prepare_filename(info)
+
+        FakeYoutubeDL.playlist_entries.insert(1, None)
+        payloads = []
+        files = []
+        converter = YouTubeConverter()
+        with patch("yt_dlp.YoutubeDL", TemplatingYoutubeDL):
+            success, _path, _error = converter.download(
+                "https://www.youtube.com/playlist?list=PLtest",
+                str(tmp_path),
+                quiet=True,
+                is_playlist=True,
+                filename_template=(
+                    "%(playlist_index)s - %(playlist_title)s - %(title)s.%(ext)s"
+                ),
+                progress_hook=payloads.append,
+                downloaded_files=files,
+            )
+        assert success is True
+        assert sorted(Path(f).name for f in files) == [
+            "1 - Playlist - A.mp3",
+            "3 - Playlist - B.mp3",
+            "4 - Playlist - C.mp3",
+        ]
+        assert {p["info_dict"]["playlist_count"] for p in payloads} == {4}
+
+
 class TestTikTokConverter:
     """Tests for TikTok converter plugin"""
 
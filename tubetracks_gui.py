@@ -10,16 +10,85 @@ Run:
 from __future__ import annotations
 
 import argparse
-import queue
+import contextlib
+import functools
+import io
+import os
+import re
 import sys
 import threading
+import time
 import tkinter as tk
+import traceback
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import asdict
 from pathlib import Path
+from types import MappingProxyType, ModuleType
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-import downloader
+if TYPE_CHECKING:
+    import downloader
+
+# Worker log lines are written to the Text widget in batches: at most every
+# LOG_FLUSH_INTERVAL seconds, or sooner once this many lines are pending
+LOG_FLUSH_INTERVAL = 0.05
+LOG_FLUSH_MAX_LINES = 200
+
+# The log keeps at most LOG_MAX_LINES lines, dropping LOG_TRIM_LINES extra
+# from the top each time it overflows
+LOG_MAX_LINES = 5000
+LOG_TRIM_LINES = 500
+
+# Distinct error groups remembered per run; later new groups only bump the total
+RUN_ERROR_MAX_GROUPS = 256
+
+# Worker queue polling interval (ms) while messages arrive / while idle
+POLL_BUSY_MS = 20
+POLL_IDLE_MS = 100
+
+# Seconds a closed window waits for a cancelled preview before giving up on
+# it; download batches are always joined (see App._wait_for_workers)
+EXIT_GRACE_SECONDS = 5.0
+
+# Lines whose first non-blank character starts a URL rather than a # comment
+_URL_LINE_RE = re.compile(r"^[^\S\n]*[^\s#]", re.MULTILINE)
+
+# Cheap http(s)://host shape check run before the per-plugin validator
+_URL_SHAPE_RE = re.compile(r"^https?://[^\s/$.?#]\S*$", re.IGNORECASE)
+
+# Digits and path/URL fragments that make otherwise identical errors differ
+_ERR_SIG_RE = re.compile(r"(?:\d+|/[^\s'\"]+)")
+
+# Startup defaults that never change while the app runs
+_DEFAULT_OUTPUT = str(Path.cwd() / "downloads")
+
+
+def _load_backend() -> ModuleType:
+    """Import the downloader backend on first use and bind it module-wide.
+
+    downloader pulls in yt-dlp and rich (~100 ms), which importing this module
+    or printing --help should not pay for. Every entry point that needs the
+    backend (App, _default_config, main) calls this first.
+    """
+    global downloader
+    import downloader
+
+    return downloader
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps ``tubetracks_gui.downloader`` working for importers and mocks
+    if name == "downloader":
+        return _load_backend()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def _default_config() -> downloader.Config:
+    """Load the CLI config file once per process, on first use."""
+    return _load_backend().load_config()
 
 
 # ==============================================================================
@@ -86,22 +155,73 @@ def add_tooltip(widget: tk.Widget, text: str) -> ToolTip:
 
 
 class App:
+    # Set once check_ffmpeg() succeeds so later runs skip the lookup
+    _ffmpeg_found = False
+
+    # Status bar text for each downloader progress stage
+    _STAGE_MESSAGES = MappingProxyType(
+        {
+            "extracting": "⚙ Extracting video information...",
+            "downloading": "⬇ Downloading audio stream...",
+            "downloaded": "✓ Download complete",
+            "converting": "♪ Converting to audio format...",
+            "metadata": "📝 Embedding metadata...",
+            "thumbnail": "🖼 Embedding thumbnail...",
+        }
+    )
+
     def __init__(self, root: tk.Tk):
+        _load_backend()
         self.root = root
         self.root.title(f"TubeTracks (GUI) v{downloader.__version__}")
         self.root.minsize(860, 620)
 
-        self._worker: Optional[threading.Thread] = None
+        # One long-lived pool runs download batches and previews; the buttons
+        # only allow one of them at a time, so a single thread is enough
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tubetracks"
+        )
+        # URLs of a batch run on a second long-lived pool, sized from the
+        # concurrent downloads setting (see _url_pool_for)
+        self._url_pool: Optional[ThreadPoolExecutor] = None
+        self._url_pool_size = 0
+        self._worker: Optional[Future] = None
+        self._preview_worker_future: Optional[Future] = None
         self._cancel_event = threading.Event()
         self._preview_cancel_event = threading.Event()
-        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        # Workers only append and the Tk thread only pops; deque ops are atomic
+        self._queue: "deque[Dict[str, Any]]" = deque()
         self._is_running = False
         self._is_previewing = False
         self._pending_logs: List[str] = []
-        self._run_errors: List[Dict[str, str]] = []
+        # Entries may hold several lines ("log_batch"), so caps count lines
+        self._pending_line_count = 0
+        self._last_log_flush = 0.0
+        self._log_line_count = 0
+        self._log_flush_pending = False
+        # Failures grouped by normalized message, with the first URL and full
+        # message seen for each group
+        self._run_errors: "Counter[str]" = Counter()
+        self._run_error_examples: Dict[str, Tuple[str, str]] = {}
+        self._run_error_total = 0
         self._run_cancelled = False
+        # With several URLs in flight the bar shows the whole batch: finished
+        # URLs plus each running playlist's share, keyed by URL
+        self._run_parallel = False
+        self._run_completed = 0
+        self._run_total = 0
+        self._url_progress: Dict[str, float] = {}
         self._last_playlist_index: Optional[int] = None
-
+        self._archive_update_pending = False
+        # Rendered "Supported Sites" dialog text; plugins don't change at runtime
+        self._plugins_text: Optional[Tuple[str, int]] = None
+        # Mirrors the progress bar's Tk state so unchanged updates skip Tcl
+        self._progress_mode = "determinate"
+        self._progress_running = False
+        # Full tracebacks in the log only when TUBETRACKS_DEBUG is set
+        self._debug_tracebacks = bool(os.environ.get("TUBETRACKS_DEBUG"))
+
+        self.root.protocol("WM_DELETE_WINDOW", self._exit_app)
         self._build_menu()
         self._build_ui()
         self._load_config_defaults()
@@ -136,21 +256,23 @@ class App:
         edit_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Edit", menu=edit_menu)
         edit_menu.add_command(
-            label="Cut", command=lambda: self._edit_command("cut"), accelerator="Ctrl+X"
+            label="Cut",
+            command=functools.partial(self._edit_command, "cut"),
+            accelerator="Ctrl+X",
         )
         edit_menu.add_command(
             label="Copy",
-            command=lambda: self._edit_command("copy"),
+            command=functools.partial(self._edit_command, "copy"),
             accelerator="Ctrl+C",
         )
         edit_menu.add_command(
             label="Paste",
-            command=lambda: self._edit_command("paste"),
+            command=functools.partial(self._edit_command, "paste"),
             accelerator="Ctrl+V",
         )
         edit_menu.add_command(
             label="Select All",
-            command=lambda: self._edit_command("select_all"),
+            command=functools.partial(self._edit_command, "select_all"),
             accelerator="Ctrl+A",
         )
 
@@ -161,37 +283,48 @@ class App:
 
     def _setup_shortcuts(self) -> None:
         """Setup keyboard shortcuts."""
-        self.root.bind("<Control-o>", lambda e: self._open_urls_file())
-        self.root.bind("<Control-s>", lambda e: self._save_log())
+        self.root.bind("<Control-o>", self._open_urls_file)
+        self.root.bind("<Control-s>", self._save_log)
+
+    def _create_context_menu(self, widget: tk.Text) -> None:
+        """Attach a cut/copy/paste context menu, built on first right-click."""
+        menu: Optional[tk.Menu] = None
 
-    def _create_context_menu(self, widget: tk.Text) -> tk.Menu:
-        """Create a context menu for text widgets with cut/copy/paste."""
+        def show_menu(event):
+            nonlocal menu
+            if menu is None:
+                menu = self._build_context_menu(widget)
+            try:
+                menu.tk_popup(event.x_root, event.y_root)
+            finally:
+                menu.grab_release()
+
+        widget.bind("<Button-3>", show_menu)
+
+    def _build_context_menu(self, widget: tk.Text) -> tk.Menu:
+        """Create the context menu for a text widget."""
         menu = tk.Menu(widget, tearoff=0)
         menu.add_command(
-            label="Cut", command=lambda: self._text_cut(widget), accelerator="Ctrl+X"
+            label="Cut",
+            command=functools.partial(self._text_cut, widget),
+            accelerator="Ctrl+X",
         )
         menu.add_command(
-            label="Copy", command=lambda: self._text_copy(widget), accelerator="Ctrl+C"
+            label="Copy",
+            command=functools.partial(self._text_copy, widget),
+            accelerator="Ctrl+C",
         )
         menu.add_command(
             label="Paste",
-            command=lambda: self._text_paste(widget),
+            command=functools.partial(self._text_paste, widget),
             accelerator="Ctrl+V",
         )
         menu.add_separator()
         menu.add_command(
             label="Select All",
-            command=lambda: self._text_select_all(widget),
+            command=functools.partial(self._text_select_all, widget),
             accelerator="Ctrl+A",
         )
-
-        def show_menu(event):
-            try:
-                menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                menu.grab_release()
-
-        widget.bind("<Button-3>", show_menu)
         return menu
 
     def _text_cut(self, widget: tk.Text) -> None:
@@ -235,7 +368,7 @@ class App:
             elif command == "select_all":
                 self._text_select_all(focused)
 
-    def _open_urls_file(self) -> None:
+    def _open_urls_file(self, event=None) -> None:
         """Open a text file containing URLs."""
         try:
             filename = filedialog.askopenfilename(
@@ -246,34 +379,25 @@ class App:
                 return
             
             try:
-                with open(filename, "r", encoding="utf-8") as f:
-                    content = f.read()
-                
-                # Count valid URLs
-                valid_urls = [
-                    line.strip()
-                    for line in content.splitlines()
-                    if line.strip() and not line.strip().startswith("#")
-                ]
-                
+                raw = Path(filename).read_bytes()
+                try:
+                    content = raw.decode("utf-8")
+                    alternate_encoding = False
+                except UnicodeDecodeError:
+                    # latin-1 maps every byte, so this fallback cannot fail
+                    content = raw.decode("latin-1")
+                    alternate_encoding = True
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+
                 self.urls_text.delete("1.0", "end")
                 self.urls_text.insert("1.0", content)
-                self._append_log(f"✓ Loaded {len(valid_urls)} URL(s) from: {filename}")
-                
-            except UnicodeDecodeError:
-                # Try with different encoding
-                try:
-                    with open(filename, "r", encoding="latin-1") as f:
-                        content = f.read()
-                    self.urls_text.delete("1.0", "end")
-                    self.urls_text.insert("1.0", content)
+                if alternate_encoding:
                     self._append_log(f"⚠ Loaded file with alternate encoding: {filename}")
-                except Exception as e:
-                    messagebox.showerror(
-                        "Encoding Error",
-                        f"Cannot decode file:\n\n{filename}\n\nError: {str(e)}"
-                    )
-                    self._append_log(f"✗ Encoding error: {filename}: {e}")
+                else:
+                    # Count valid URLs
+                    url_count = len(_URL_LINE_RE.findall(content))
+                    self._append_log(f"✓ Loaded {url_count} URL(s) from: {filename}")
+
             except PermissionError:
                 messagebox.showerror(
                     "Permission Denied",
@@ -293,7 +417,7 @@ class App:
             messagebox.showerror("Unexpected Error", f"Error opening file dialog:\n\n{str(e)}")
             self._append_log(f"✗ Unexpected error in file dialog: {e}")
 
-    def _save_log(self) -> None:
+    def _save_log(self, event=None) -> None:
         """Save the log to a file."""
         try:
             filename = filedialog.asksaveasfilename(
@@ -305,14 +429,13 @@ class App:
                 return
             
             try:
+                self._flush_log_buffer()
                 content = self.log_text.get("1.0", "end")
                 
                 # Ensure parent directory exists
-                from pathlib import Path
-                Path(filename).parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(content)
+                log_path = Path(filename)
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                log_path.write_text(content, encoding="utf-8", errors="replace")
                 
                 messagebox.showinfo("Success", f"Log saved to:\n\n{filename}")
                 self._append_log(f"✓ Log saved to: {filename}")
@@ -347,9 +470,11 @@ class App:
     def _clear_log(self) -> None:
         """Clear the log text box."""
         if messagebox.askyesno("Clear Log", "Clear the log?"):
-            self.log_text.configure(state="normal")
-            self.log_text.delete("1.0", "end")
-            self.log_text.configure(state="disabled")
+            self._pending_logs.clear()
+            self._pending_line_count = 0
+            with self._editable_log():
+                self.log_text.delete("1.0", "end")
+            self._log_line_count = 0
 
     def _show_about(self) -> None:
         """Show about dialog."""
@@ -363,12 +488,48 @@ class App:
 
     def _exit_app(self) -> None:
         """Exit the application."""
-        if self._worker and self._worker.is_alive():
-            if messagebox.askyesno("Exit", "Download in progress. Exit anyway?"):
-                self._cancel_event.set()
-                self.root.quit()
-        else:
-            self.root.quit()
+        if self._worker is not None and not self._worker.done():
+            if not messagebox.askyesno("Exit", "Download in progress. Exit anyway?"):
+                return
+        # Close the window right away; main() waits for the cancelled
+        # workers once the mainloop has returned
+        self._stop_workers()
+        self.root.destroy()
+
+    def _stop_workers(self) -> None:
+        """Ask running previews and downloads to stop without waiting for them."""
+        self._cancel_event.set()
+        self._preview_cancel_event.set()
+        self._executor.shutdown(wait=False)
+        if self._url_pool is not None:
+            self._url_pool.shutdown(wait=False)
+
+    def _url_pool_for(self, size: int) -> ThreadPoolExecutor:
+        """Return the per-URL pool, rebuilt only when the concurrency changes.
+
+        Called from the batch coordinator; only one batch runs at a time.
+        """
+        if self._url_pool is None or self._url_pool_size != size:
+            if self._url_pool is not None:
+                self._url_pool.shutdown(wait=False)
+            self._url_pool = ThreadPoolExecutor(
+                max_workers=size, thread_name_prefix="tubetracks-url"
+            )
+            self._url_pool_size = size
+        return self._url_pool
+
+    def _wait_for_workers(self, timeout: float) -> bool:
+        """Join cancelled workers; True once all of them have stopped.
+
+        A download batch is always waited for: cancellation is cooperative
+        and an ffmpeg conversion already running is left to finish its file.
+        A preview only reads metadata, so it gets ``timeout`` seconds.
+        """
+        if self._worker is not None:
+            wait([self._worker])
+        if self._preview_worker_future is None:
+            return True
+        return not wait([self._preview_worker_future], timeout=timeout).not_done
 
     def _build_ui(self) -> None:
         outer = ttk.Frame(self.root, padding=12)
@@ -397,13 +558,12 @@ class App:
         # Options row
         options = ttk.Frame(outer)
         options.grid(row=2, column=0, sticky="ew")
-        for i in range(8):
-            options.columnconfigure(i, weight=0)
-        options.columnconfigure(1, weight=1)
-        options.columnconfigure(6, weight=1)
+        # Unconfigured columns already default to weight 0
+        for col in (1, 6):
+            options.columnconfigure(col, weight=1)
 
         ttk.Label(options, text="Save to folder:").grid(row=0, column=0, sticky="w")
-        self.output_var = tk.StringVar(value=str(Path.cwd() / "downloads"))
+        self.output_var = tk.StringVar(value=_DEFAULT_OUTPUT)
         self.output_entry = ttk.Entry(options, textvariable=self.output_var)
         self.output_entry.grid(row=0, column=1, sticky="ew", padx=(8, 8))
         add_tooltip(self.output_entry, "Where your downloaded files will be saved")
@@ -447,7 +607,10 @@ class App:
             "vorbis": "Vorbis (open)",
             "mp4": "MP4 (video)",
         }
-        format_display = [self._format_descriptions.get(f, f) for f in downloader.SUPPORTED_FORMATS]
+        self._format_reverse = {v: k for k, v in self._format_descriptions.items()}
+        format_display = tuple(
+            self._format_descriptions.get(f, f) for f in downloader.SUPPORTED_FORMATS
+        )
         self.format_combo = ttk.Combobox(
             options,
             values=format_display,
@@ -462,8 +625,6 @@ class App:
         # Secondary options - with user-friendly labels
         options2 = ttk.Frame(outer)
         options2.grid(row=3, column=0, sticky="ew", pady=(10, 10))
-        for i in range(14):
-            options2.columnconfigure(i, weight=0)
         options2.columnconfigure(11, weight=1)
 
         self.playlist_var = tk.BooleanVar(value=False)
@@ -538,8 +699,8 @@ class App:
         self.advanced_frame.grid(row=4, column=0, sticky="ew", pady=(0, 10))
         self.advanced_frame.grid_remove()  # Hide by default
         
-        for i in range(7):
-            self.advanced_frame.columnconfigure(i, weight=1 if i in (1, 4, 6) else 0)
+        for col in (1, 4, 6):
+            self.advanced_frame.columnconfigure(col, weight=1)
 
         # Row 0: Archive file and Template
         ttk.Label(self.advanced_frame, text="History file:").grid(row=0, column=0, sticky="w", padx=4, pady=4)
@@ -671,12 +832,8 @@ class App:
                         self._append_log(f"⚠ Folder selection cancelled")
                         return
                 else:
-                    # Test write permissions
-                    test_file = test_path / ".write_test"
-                    try:
-                        test_file.touch()
-                        test_file.unlink()
-                    except PermissionError:
+                    # Test write permissions without touching the disk
+                    if not os.access(folder, os.W_OK):
                         messagebox.showwarning(
                             "Permission Warning",
                             f"Folder may not be writable:\n\n{folder}\n\nYou may encounter errors during download."
@@ -725,9 +882,9 @@ class App:
                     self._append_log(f"✗ Cookies file not found: {filename}")
                     return
                 
-                # Try to read it to verify permissions
-                with open(filename, 'r') as f:
-                    f.read(1)  # Just read first byte
+                # Verify read permission without opening the file
+                if not os.access(filename, os.R_OK):
+                    raise PermissionError(filename)
                 
                 self.cookies_var.set(filename)
                 self._append_log(f"✓ Selected cookies file: {filename}")
@@ -751,7 +908,7 @@ class App:
 
     def _load_config_defaults(self) -> None:
         """Load CLI configuration defaults so GUI stays in sync."""
-        config = downloader.load_config()
+        config = _default_config()
         self.quality_var.set(config.quality)
         self.format_var.set(config.format)
         if config.output:
@@ -809,10 +966,10 @@ class App:
         """Handle format combobox selection - map display text to internal value."""
         display_value = self.format_combo.get()
         # Find actual format from display text
-        for fmt, desc in self._format_descriptions.items():
-            if desc == display_value:
-                self.format_var.set(fmt)
-                return
+        fmt = self._format_reverse.get(display_value)
+        if fmt is not None:
+            self.format_var.set(fmt)
+            return
         # Fallback: if display matches format directly
         if display_value in downloader.SUPPORTED_FORMATS:
             self.format_var.set(display_value)
@@ -833,38 +990,59 @@ class App:
             self._append_log("Advanced options shown")
 
     def _append_log(self, line: str) -> None:
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", line + "\n")
-        self.log_text.see("end")
-        self.log_text.configure(state="disabled")
-        self._trim_log_if_needed()
+        """Queue a GUI-side log line; lines logged in one burst share one insert."""
+        # Buffered behind any pending worker lines so the log stays in order
+        self._buffer_log(line)
+        if self._log_flush_pending:
+            return
+        self._log_flush_pending = True
+        self.root.after_idle(self._apply_log_flush)
+
+    def _apply_log_flush(self) -> None:
+        self._log_flush_pending = False
+        self._flush_log_buffer()
 
     def _buffer_log(self, line: str) -> None:
         """Buffer log lines to keep UI responsive during heavy output."""
+        lines = line.count("\n") + 1
         self._pending_logs.append(line)
+        self._pending_line_count += lines
+        self._log_line_count += lines
+
+    @contextlib.contextmanager
+    def _editable_log(self) -> Iterator[None]:
+        """Unlock the read-only log widget for the duration of a batch of edits."""
+        self.log_text.configure(state="normal")
+        try:
+            yield
+        finally:
+            self.log_text.configure(state="disabled")
 
     def _flush_log_buffer(self) -> None:
         if not self._pending_logs:
             return
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", "\n".join(self._pending_logs) + "\n")
-        self.log_text.see("end")
-        self.log_text.configure(state="disabled")
+        text = "\n".join(self._pending_logs)
+        if self._pending_line_count > LOG_MAX_LINES:
+            # Skip inserting lines the trim below would delete straight away
+            dropped = self._pending_line_count - LOG_MAX_LINES
+            text = text.split("\n", dropped)[-1]
+            self._log_line_count -= dropped
         self._pending_logs.clear()
-        self._trim_log_if_needed()
+        self._pending_line_count = 0
+        with self._editable_log():
+            self.log_text.insert("end", text + "\n")
+            self._trim_log_if_needed()
+            self.log_text.see("end")
+        self._last_log_flush = time.monotonic()
 
     def _trim_log_if_needed(self) -> None:
-        """Prevent the log widget from growing unbounded."""
-        max_lines = 5000
-        trim_lines = 500
-        try:
-            line_count = int(float(self.log_text.index("end-1c").split(".")[0]))
-        except Exception:
+        """Prevent the log widget from growing unbounded (caller unlocks it)."""
+        # Tracked in Python so the common case costs no Tk index() round trip
+        if self._log_line_count <= LOG_MAX_LINES:
             return
-        if line_count > max_lines:
-            self.log_text.configure(state="normal")
-            self.log_text.delete("1.0", f"{trim_lines + 1}.0")
-            self.log_text.configure(state="disabled")
+        excess = self._log_line_count - LOG_MAX_LINES + LOG_TRIM_LINES
+        self.log_text.delete("1.0", f"{excess + 1}.0")
+        self._log_line_count -= excess
 
     def _set_running(self, running: bool) -> None:
         """Enable or disable controls based on running state."""
@@ -888,7 +1066,15 @@ class App:
         self._update_archive_entry_state()
 
     def _update_archive_entry_state(self, *_args) -> None:
+        """Schedule an archive entry refresh; bursts of writes share one."""
+        if self._archive_update_pending:
+            return
+        self._archive_update_pending = True
+        self.root.after_idle(self._apply_archive_entry_state)
+
+    def _apply_archive_entry_state(self) -> None:
         """Enable/disable archive entry based on checkbox and running state."""
+        self._archive_update_pending = False
         state = (
             "normal"
             if (not self._is_running and self.use_archive_var.get())
@@ -902,11 +1088,12 @@ class App:
             messagebox.showerror("Missing URLs", "Please paste at least one URL.")
             return None
 
-        urls = [
-            u.strip()
-            for u in urls_raw.splitlines()
-            if u.strip() and not u.strip().startswith("#")
-        ]
+        urls = []
+        # Tk text content only ever uses "\n"; a stray "\r" is stripped below
+        for raw in urls_raw.split("\n"):
+            url = raw.strip()
+            if url and url[0] != "#":
+                urls.append(url)
         if not urls:
             messagebox.showerror("Missing URLs", "No valid URLs found.")
             return None
@@ -918,17 +1105,6 @@ class App:
             )
             return None
 
-        # GUI-friendly checks (no Rich output)
-        ff_ok, ff_msg = downloader.check_ffmpeg()
-        if not ff_ok:
-            messagebox.showerror("FFmpeg not found", ff_msg)
-            return None
-
-        dir_ok, dir_msg = downloader.check_output_dir(output_dir)
-        if not dir_ok:
-            messagebox.showerror("Output folder error", dir_msg)
-            return None
-
         cookies_path = self.cookies_var.get().strip()
         if cookies_path and not Path(cookies_path).exists():
             messagebox.showerror("Cookies file not found", cookies_path)
@@ -936,8 +1112,13 @@ class App:
 
         # Validate URL formats
         invalid = []
+        validate_url = downloader.validate_url
         for url in urls:
-            ok, msg = downloader.validate_url(url)
+            # Malformed lines never reach the plugin registry lookup
+            if not _URL_SHAPE_RE.match(url):
+                invalid.append(f"{url} — Malformed URL (expected http:// or https://)")
+                continue
+            ok, msg = validate_url(url)
             if not ok:
                 invalid.append(f"{url} — {msg}")
         if invalid:
@@ -946,52 +1127,68 @@ class App:
 
         return urls
 
-    def _collect_options(self) -> Dict[str, Any]:
-        """Collect current form values for worker thread usage."""
-        template = self.template_var.get().strip() or "%(title)s.%(ext)s"
-        
-        # Validate and correct retries
-        try:
-            retries = max(0, int(self.retries_var.get()))
-            if retries > 10:
-                self._append_log(f"⚠ Warning: Retries capped at 10 (was {retries})")
-                retries = 10
-        except (tk.TclError, ValueError) as e:
-            self._append_log(f"⚠ Invalid retries value, using default (3): {e}")
-            retries = 3
-        
-        # Validate and correct concurrent downloads
+    def _check_environment(self, output_dir: str) -> Optional[Tuple[str, str]]:
+        """Run the blocking FFmpeg and output folder checks off the Tk thread.
+
+        Returns a ``(title, message)`` pair describing the first failure.
+        """
+        # GUI-friendly checks (no Rich output)
+        if not App._ffmpeg_found:
+            ff_ok, ff_msg = downloader.check_ffmpeg()
+            if not ff_ok:
+                return "FFmpeg not found", ff_msg
+            # FFmpeg does not disappear mid-session; skip the lookup next time
+            App._ffmpeg_found = True
+
+        dir_ok, dir_msg = downloader.check_output_dir(output_dir)
+        if not dir_ok:
+            return "Output folder error", dir_msg
+        return None
+
+    @staticmethod
+    def _sget(var: tk.Variable, default: Any = "") -> Any:
+        """Return a Tk variable's stripped text, or ``default`` when blank."""
+        return var.get().strip() or default
+
+    @staticmethod
+    def _read_int(
+        var: tk.Variable, default: int, lo: int, hi: int, label: str
+    ) -> Tuple[int, Optional[str]]:
+        """Read an int Tk variable clamped to ``lo..hi``, plus any warning."""
         try:
-            concurrent = int(self.concurrent_var.get())
-            if concurrent < 1:
-                self._append_log("⚠ Concurrent downloads must be >= 1, using 1")
-                concurrent = 1
-            elif concurrent > 5:
-                self._append_log(f"⚠ Concurrent downloads capped at 5 (was {concurrent})")
-                concurrent = 5
+            value = int(var.get())
         except (tk.TclError, ValueError) as e:
-            self._append_log(f"⚠ Invalid concurrent value, using default (1): {e}")
-            concurrent = 1
+            return default, f"⚠ Invalid {label} value, using default ({default}): {e}"
+        if value < lo:
+            return lo, f"⚠ {label.capitalize()} must be >= {lo}, using {lo}"
+        if value > hi:
+            return hi, f"⚠ {label.capitalize()} capped at {hi} (was {value})"
+        return value, None
+
+    def _collect_options(self) -> Dict[str, Any]:
+        """Collect current form values for worker thread usage."""
+        sget = self._sget
+        retries, retries_warning = self._read_int(self.retries_var, 3, 0, 10, "retries")
+        concurrent, concurrent_warning = self._read_int(
+            self.concurrent_var, 1, 1, 5, "concurrent downloads"
+        )
 
         archive_file = None
         if self.use_archive_var.get():
-            try:
-                archive_file = self.archive_var.get().strip() or str(
-                    downloader.DEFAULT_ARCHIVE_FILE
-                )
-            except Exception as e:
-                self._append_log(f"⚠ Archive file error, using default: {e}")
-                archive_file = str(downloader.DEFAULT_ARCHIVE_FILE)
+            archive_file = sget(self.archive_var, str(downloader.DEFAULT_ARCHIVE_FILE))
 
-        cookies_file = self.cookies_var.get().strip() or None
-        proxy = self.proxy_var.get().strip() or None
-        rate_limit = self.rate_limit_var.get().strip() or None
+        # Warnings are written to the log together, in one flush
+        warnings = [w for w in (retries_warning, concurrent_warning) if w]
+        if warnings:
+            for warning in warnings:
+                self._buffer_log(warning)
+            self._flush_log_buffer()
 
         return {
-            "output_dir": self.output_var.get().strip(),
-            "quality": self.quality_var.get().strip(),
-            "audio_format": self.format_var.get().strip(),
-            "template": template,
+            "output_dir": sget(self.output_var),
+            "quality": sget(self.quality_var),
+            "audio_format": sget(self.format_var),
+            "template": sget(self.template_var, "%(title)s.%(ext)s"),
             "is_playlist": bool(self.playlist_var.get()),
             "embed_metadata": bool(self.metadata_var.get()),
             "embed_thumbnail": bool(self.thumbnail_var.get()),
@@ -999,9 +1196,9 @@ class App:
             "concurrent_downloads": concurrent,
             "skip_existing": bool(self.skip_existing_var.get()),
             "archive_file": archive_file,
-            "proxy": proxy,
-            "rate_limit": rate_limit,
-            "cookies_file": cookies_file,
+            "proxy": sget(self.proxy_var, None),
+            "rate_limit": sget(self.rate_limit_var, None),
+            "cookies_file": sget(self.cookies_var, None),
         }
 
     def _preview(self) -> None:
@@ -1023,30 +1220,32 @@ class App:
         self.stop_preview_btn.configure(state="normal")
         
         # Set up progress indication
-        self.progress.configure(mode="indeterminate")
-        self.progress.start(10)
+        self._start_progress()
         self.status_var.set("🔍 Fetching preview...")
         
         options = self._collect_options()
         url = urls[0]
         
-        # Run preview in background thread
-        preview_thread = threading.Thread(
-            target=self._preview_worker,
-            args=(url, options),
-            daemon=True
-        )
-        preview_thread.start()
+        # Run preview on the shared worker pool
+        future = self._executor.submit(self._preview_worker, url, options)
+        future.add_done_callback(self._report_worker_crash)
+        self._preview_worker_future = future
 
     def _preview_worker(self, url: str, options: Dict[str, Any]) -> None:
         """Background worker for preview operation."""
         try:
-            self._queue.put({"type": "log", "text": f"🔍 Fetching preview for: {url}"})
-            self._queue.put({"type": "status", "text": "🔍 Connecting to platform..."})
+            self._queue.append({"type": "log", "text": f"🔍 Fetching preview for: {url}"})
+            self._queue.append({"type": "status", "text": "🔍 Connecting to platform..."})
+
+            failure = self._check_environment(options["output_dir"])
+            if failure:
+                title, message = failure
+                self._queue.append({"type": "preview_error", "title": title, "message": message})
+                return
             
             # Check if cancelled before starting
             if self._preview_cancel_event.is_set():
-                self._queue.put({"type": "log", "text": "⊘ Preview cancelled by user"})
+                self._queue.append({"type": "log", "text": "⊘ Preview cancelled by user"})
                 return
             
             # Extract info with progress updates
@@ -1060,14 +1259,14 @@ class App:
             )
 
             if self._preview_cancel_event.is_set():
-                self._queue.put({"type": "log", "text": "⊘ Preview cancelled by user"})
+                self._queue.append({"type": "log", "text": "⊘ Preview cancelled by user"})
                 return
             
             if not info:
                 if self._preview_cancel_event.is_set():
-                    self._queue.put({"type": "log", "text": "⊘ Preview cancelled by user"})
+                    self._queue.append({"type": "log", "text": "⊘ Preview cancelled by user"})
                     return
-                self._queue.put({
+                self._queue.append({
                     "type": "preview_error",
                     "title": "Preview Failed",
                     "message": "Unable to extract information from URL.\n\nPossible causes:\n"
@@ -1076,11 +1275,11 @@ class App:
                                "• Content is private or restricted\n"
                                "• Platform changes or updates needed"
                 })
-                self._queue.put({"type": "log", "text": "✗ Preview failed – unable to extract info"})
+                self._queue.append({"type": "log", "text": "✗ Preview failed – unable to extract info"})
                 return
 
             # Send preview data to main thread
-            self._queue.put({
+            self._queue.append({
                 "type": "preview_ready",
                 "url": url,
                 "info": info
@@ -1088,41 +1287,41 @@ class App:
             
         except downloader.DownloadError as e:
             if self._preview_cancel_event.is_set():
-                self._queue.put({"type": "log", "text": "⊘ Preview cancelled by user"})
+                self._queue.append({"type": "log", "text": "⊘ Preview cancelled by user"})
                 return
-            self._queue.put({
+            self._queue.append({
                 "type": "preview_error",
                 "title": "Download Error",
                 "message": f"Failed to fetch preview:\n\n{str(e)}"
             })
-            self._queue.put({"type": "log", "text": f"✗ Preview error: {e}"})
+            self._queue.append({"type": "log", "text": f"✗ Preview error: {e}"})
         except ConnectionError as e:
             if self._preview_cancel_event.is_set():
-                self._queue.put({"type": "log", "text": "⊘ Preview cancelled by user"})
+                self._queue.append({"type": "log", "text": "⊘ Preview cancelled by user"})
                 return
-            self._queue.put({
+            self._queue.append({
                 "type": "preview_error",
                 "title": "Network Error",
                 "message": f"Connection failed while fetching preview:\n\n{str(e)}\n\n"
                            "Please check your internet connection."
             })
-            self._queue.put({"type": "log", "text": f"✗ Network error: {e}"})
+            self._queue.append({"type": "log", "text": f"✗ Network error: {e}"})
         except Exception as e:
             if self._preview_cancel_event.is_set():
-                self._queue.put({"type": "log", "text": "⊘ Preview cancelled by user"})
+                self._queue.append({"type": "log", "text": "⊘ Preview cancelled by user"})
                 return
-            self._queue.put({
+            self._queue.append({
                 "type": "preview_error",
                 "title": "Unexpected Error",
                 "message": f"An unexpected error occurred:\n\n{type(e).__name__}: {str(e)}\n\n"
                            "Please check the log for details."
             })
-            self._queue.put({"type": "log", "text": f"✗ Unexpected preview error: {type(e).__name__}: {e}"})
-            import traceback
-            self._queue.put({"type": "log", "text": f"Traceback: {traceback.format_exc()}"})
+            self._queue.append({"type": "log", "text": f"✗ Unexpected preview error: {type(e).__name__}: {e}"})
+            if self._debug_tracebacks:
+                self._queue.append({"type": "log_exc", "exc": e})
         finally:
             # Always restore UI state
-            self._queue.put({"type": "preview_complete"})
+            self._queue.append({"type": "preview_complete"})
 
     def _fetch_preview_with_progress(
         self,
@@ -1139,8 +1338,8 @@ class App:
             if self._preview_cancel_event.is_set():
                 return None
                 
-            self._queue.put({"type": "log", "text": "  → Extracting metadata..."})
-            self._queue.put({"type": "status", "text": "🔍 Extracting metadata..."})
+            self._queue.append({"type": "log", "text": "  → Extracting metadata..."})
+            self._queue.append({"type": "status", "text": "🔍 Extracting metadata..."})
             
             info = downloader.dry_run_info(
                 url=url,
@@ -1158,72 +1357,71 @@ class App:
             if info:
                 video_count = info.get("video_count", 0)
                 is_playlist_result = info.get("is_playlist", False)
+                videos = info.get("videos") or ()
+                # Summary lines travel as one message instead of one per video
+                lines: List[str] = []
                 
                 if is_playlist_result:
-                    self._queue.put({"type": "log", "text": f"  ✓ Found playlist with {video_count} videos"})
-                    self._queue.put({"type": "status", "text": f"✓ Playlist: {video_count} videos"})
+                    lines.append(f"  ✓ Found playlist with {video_count} videos")
+                    status = f"✓ Playlist: {video_count} videos"
                     
-                    # Log each video as we process it
-                    videos = info.get("videos", [])
                     for idx, video in enumerate(videos[:10], 1):
-                        # Check if cancelled during video processing
-                        if self._preview_cancel_event.is_set():
-                            self._queue.put({"type": "log", "text": "  ⊘ Preview cancelled"})
-                            return None
-                        title = video.get("title", "Unknown")
-                        self._queue.put({"type": "log", "text": f"    [{idx}] {title}"})
+                        lines.append(f"    [{idx}] {video.get('title', 'Unknown')}")
                         
                     if video_count > 10:
-                        self._queue.put({"type": "log", "text": f"    ... and {video_count - 10} more videos"})
+                        lines.append(f"    ... and {video_count - 10} more videos")
                 else:
-                    title = info.get("videos", [{}])[0].get("title", "Unknown") if info.get("videos") else "Unknown"
-                    self._queue.put({"type": "log", "text": f"  ✓ Found video: {title}"})
-                    self._queue.put({"type": "status", "text": "✓ Preview ready"})
+                    title = videos[0].get("title", "Unknown") if videos else "Unknown"
+                    lines.append(f"  ✓ Found video: {title}")
+                    status = "✓ Preview ready"
                 
-                self._queue.put({"type": "log", "text": f"  → Format: {audio_format} @ {quality} quality"})
+                lines.append(f"  → Format: {audio_format} @ {quality} quality")
+                self._queue.append({"type": "log_batch", "lines": lines})
+                self._queue.append({"type": "status", "text": status})
             
             return info
             
         except Exception as e:
-            self._queue.put({"type": "log", "text": f"  ✗ Error during preview fetch: {e}"})
+            self._queue.append({"type": "log", "text": f"  ✗ Error during preview fetch: {e}"})
             raise
 
     def _display_preview_info(self, url: str, info: Dict[str, Any]) -> None:
         """Render preview data in a dialog."""
         videos = info.get("videos", [])
         total = info.get("video_count", len(videos))
-        preview_rows = []
+        buf = io.StringIO()
 
-        header = []
         if info.get("playlist_title"):
-            header.append(f"Playlist: {info['playlist_title']}")
-        header.append(f"Videos: {total}")
-        header.append(f"Format: {info.get('format')}")
-        header.append(f"Output: {info.get('output_dir')}")
-        preview_rows.extend(header)
-        preview_rows.append("")
+            buf.write(f"Playlist: {info['playlist_title']}\n")
+        buf.write(f"Videos: {total}\n")
+        buf.write(f"Format: {info.get('format')}\n")
+        buf.write(f"Output: {info.get('output_dir')}\n")
 
         for idx, video in enumerate(videos[:5], 1):
             duration = video.get("duration")
             if isinstance(duration, (int, float)):
-                minutes = int(duration) // 60
-                seconds = int(duration) % 60
+                minutes, seconds = divmod(int(duration), 60)
                 duration_str = f"{minutes}:{seconds:02d}"
             else:
                 duration_str = "N/A"
-            preview_rows.append(
-                f"{idx}. {video.get('title', 'Unknown')} ({duration_str})\n   → {video.get('resolved_path')}"
+            buf.write(
+                f"\n{idx}. {video.get('title', 'Unknown')} ({duration_str})\n   → {video.get('resolved_path')}"
             )
 
         remaining = max(0, len(videos) - 5)
         if remaining:
-            preview_rows.append(f"...and {remaining} more item(s)")
+            buf.write(f"\n...and {remaining} more item(s)")
 
-        messagebox.showinfo("Dry Run Preview", "\n".join(preview_rows))
+        messagebox.showinfo("Dry Run Preview", buf.getvalue())
         self._append_log(f"Preview ready for {url}")
 
     def _show_plugins(self) -> None:
         """Display supported plugin platforms."""
+        if self._plugins_text is not None:
+            text, count = self._plugins_text
+            messagebox.showinfo("Supported Platforms", text)
+            self._append_log(f"✓ Displayed {count} supported plugins")
+            return
         try:
             platforms = downloader.list_supported_platforms()
             if not platforms:
@@ -1255,9 +1453,9 @@ class App:
                 )
                 return
 
-            messagebox.showinfo(
-                "Supported Platforms", "\n".join(lines) + f"\n\nTotal: {len(platforms)}"
-            )
+            text = "\n".join(lines) + f"\n\nTotal: {len(platforms)}"
+            self._plugins_text = (text, len(platforms))
+            messagebox.showinfo("Supported Platforms", text)
             self._append_log(f"✓ Displayed {len(platforms)} supported plugins")
         except Exception as e:
             messagebox.showerror(
@@ -1267,7 +1465,7 @@ class App:
             self._append_log(f"✗ Error loading plugins: {e}")
 
     def _start(self) -> None:
-        if self._worker and self._worker.is_alive():
+        if self._worker is not None and not self._worker.done():
             return
 
         urls = self._validate_inputs()
@@ -1277,21 +1475,25 @@ class App:
         options = self._collect_options()
         self._cancel_event.clear()
         self._run_errors.clear()
+        self._run_error_examples.clear()
+        self._run_error_total = 0
         self._run_cancelled = False
-        self.progress.configure(mode="determinate")
+        self._run_total = len(urls)
+        self._run_completed = 0
+        self._run_parallel = min(options["concurrent_downloads"], len(urls)) > 1
+        self._url_progress.clear()
+        self._set_progress_mode("determinate")
         self.progress["value"] = 0
         self.status_var.set("Starting…")
         self._append_log("---")
         self._append_log(f"Starting batch: {len(urls)} URL(s)")
 
         self._set_running(True)
-        self._worker = threading.Thread(
-            target=self._run_worker, args=(urls, options), daemon=True
-        )
-        self._worker.start()
+        self._worker = self._executor.submit(self._run_worker, urls, options)
+        self._worker.add_done_callback(self._report_worker_crash)
 
     def _cancel(self) -> None:
-        if self._worker and self._worker.is_alive():
+        if self._worker is not None and not self._worker.done():
             self._cancel_event.set()
             self.status_var.set("Cancelling…")
             self._append_log("Cancel requested…")
@@ -1305,6 +1507,14 @@ class App:
             self._append_log("⊘ Preview stop requested…")
             self.stop_preview_btn.configure(state="disabled")
 
+    def _report_worker_crash(self, future: Future) -> None:
+        """Surface an exception that escaped a worker so the UI is not left busy."""
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            self._queue.append({"type": "error", "message": f"{type(exc).__name__}: {exc}"})
+
     def _run_worker(self, urls: List[str], options: Dict[str, Any]) -> None:
         """Worker thread for processing downloads with comprehensive error handling."""
         try:
@@ -1327,39 +1537,58 @@ class App:
             completed = 0
             total = len(urls)
         except KeyError as e:
-            self._queue.put({"type": "log", "text": f"✗ Configuration error: Missing option {e}"})
-            self._queue.put({"type": "error", "message": f"Configuration error: {e}"})
+            self._queue.append({"type": "log", "text": f"✗ Configuration error: Missing option {e}"})
+            self._queue.append({"type": "error", "message": f"Configuration error: {e}"})
             return
         except Exception as e:
-            self._queue.put({"type": "log", "text": f"✗ Worker initialization error: {e}"})
-            self._queue.put({"type": "error", "message": f"Initialization failed: {e}"})
+            self._queue.append({"type": "log", "text": f"✗ Worker initialization error: {e}"})
+            self._queue.append({"type": "error", "message": f"Initialization failed: {e}"})
+            return
+
+        # Bound once; the names below are used for every URL in the batch
+        post = self._queue.append
+        cancel_requested = self._cancel_event.is_set
+        DownloadResult = downloader.DownloadResult
+        ErrorCode = downloader.ErrorCode
+
+        failure = self._check_environment(output_dir)
+        if failure:
+            title, message = failure
+            post({"type": "log", "text": f"✗ {title}: {message}"})
+            post({"type": "check_failed", "title": title, "message": message})
             return
 
         def progress_callback(payload: Dict[str, Any]) -> None:
             # payload comes from worker thread
-            self._queue.put({"type": "progress", "payload": payload})
+            post({"type": "progress", "payload": payload})
 
         def playlist_progress_callback(
-            current: int, total_items: int, title: str
+            current: int, total_items: int, title: str, url: str
         ) -> None:
-            # Playlist-specific progress
-            self._queue.put(
+            # Playlist-specific progress, tagged with the URL it belongs to
+            post(
                 {
                     "type": "playlist_progress",
+                    "url": url,
                     "current": current,
                     "total": total_items,
                     "title": title,
                 }
             )
 
-        for idx, url in enumerate(urls, 1):
-            if self._cancel_event.is_set():
-                self._queue.put({"type": "cancelled"})
-                return
+        # URLs draw from the same concurrency budget as the playlist entries
+        # inside them, so N parallel URLs never run N * concurrent downloads
+        workers = max(1, min(concurrent, total))
+        per_url_concurrent = max(1, concurrent // workers)
+
+        def download_one(idx: int, url: str) -> Optional[DownloadResult]:
+            # URLs still queued when the user cancels are never started
+            if cancel_requested():
+                return None
 
             try:
-                self._queue.put({"type": "status", "text": f"Processing {idx}/{total}"})
-                self._queue.put({"type": "log", "text": f"→ {url}"})
+                post({"type": "status", "text": f"Processing {idx}/{total}"})
+                post({"type": "log", "text": f"→ {url}"})
 
                 result = downloader.download_audio(
                     url=url,
@@ -1378,86 +1607,145 @@ class App:
                     cookies_file=cookies_file,
                     progress_callback=progress_callback,
                     cancel_event=self._cancel_event,
-                    concurrent_downloads=concurrent,
+                    concurrent_downloads=per_url_concurrent,
                     skip_existing=skip_existing,
-                    playlist_progress_callback=playlist_progress_callback,
+                    playlist_progress_callback=functools.partial(
+                        playlist_progress_callback, url=url
+                    ),
                 )
             except PermissionError as e:
-                result = downloader.DownloadResult(
+                result = DownloadResult(
                     success=False,
                     url=url,
-                    error_code=downloader.ErrorCode.PERMISSION_ERROR,
+                    error_code=ErrorCode.PERMISSION_ERROR,
                     error_message=f"Permission denied: {str(e)}",
                 )
-                self._queue.put({"type": "log", "text": f"✗ Permission error for {url}: {e}"})
+                post({"type": "log", "text": f"✗ Permission error for {url}: {e}"})
             except ConnectionError as e:
-                result = downloader.DownloadResult(
+                result = DownloadResult(
                     success=False,
                     url=url,
-                    error_code=downloader.ErrorCode.NETWORK_ERROR,
+                    error_code=ErrorCode.NETWORK_ERROR,
                     error_message=f"Network error: {str(e)}",
                 )
-                self._queue.put({"type": "log", "text": f"✗ Network error for {url}: {e}"})
+                post({"type": "log", "text": f"✗ Network error for {url}: {e}"})
             except TimeoutError as e:
-                result = downloader.DownloadResult(
+                result = DownloadResult(
                     success=False,
                     url=url,
-                    error_code=downloader.ErrorCode.TIMEOUT_ERROR,
+                    error_code=ErrorCode.TIMEOUT_ERROR,
                     error_message=f"Download timed out: {str(e)}",
                 )
-                self._queue.put({"type": "log", "text": f"✗ Timeout for {url}: {e}"})
+                post({"type": "log", "text": f"✗ Timeout for {url}: {e}"})
             except Exception as e:
-                result = downloader.DownloadResult(
+                result = DownloadResult(
                     success=False,
                     url=url,
-                    error_code=downloader.ErrorCode.UNKNOWN_ERROR,
+                    error_code=ErrorCode.UNKNOWN_ERROR,
                     error_message=f"Unexpected error: {type(e).__name__}: {str(e)}",
                 )
-                self._queue.put({"type": "log", "text": f"✗ Unexpected error for {url}: {type(e).__name__}: {e}"})
-                import traceback
-                self._queue.put({"type": "log", "text": f"Traceback: {traceback.format_exc()}"})
+                post({"type": "log", "text": f"✗ Unexpected error for {url}: {type(e).__name__}: {e}"})
+                if self._debug_tracebacks:
+                    post({"type": "log_exc", "exc": e})
+
+            return result
+
+        cancelled = False
+        pool = self._url_pool_for(max(1, concurrent))
+        futures = {
+            pool.submit(download_one, idx, url): url
+            for idx, url in enumerate(urls, 1)
+        }
+        # Each URL reports as soon as it finishes, so a slow first URL doesn't
+        # hold back the rest; after a cancel, URLs that were already running
+        # still report. Only this thread touches ``completed``.
+        for future in as_completed(futures):
+            url = futures[future]
+            result = future.result()
+            if result is None:
+                cancelled = True
+                continue
 
             completed += 1
-            self._queue.put(
+            post(
                 {
                     "type": "result",
+                    "url": url,
                     "result": result,
                     "completed": completed,
                     "total": total,
                 }
             )
+            if result.error_code == ErrorCode.CANCELLED:
+                cancelled = True
 
-            if result.error_code == downloader.ErrorCode.CANCELLED:
-                self._queue.put({"type": "cancelled"})
-                return
-
-        self._queue.put({"type": "done"})
+        post({"type": "cancelled" if cancelled else "done"})
 
     def _poll_queue(self) -> None:
         """Poll the queue for messages from the worker thread."""
+        batch: List[Dict[str, Any]] = []
         try:
-            processed = 0
-            max_messages = 50
-            while processed < max_messages:
-                msg = self._queue.get_nowait()
+            try:
+                while True:
+                    batch.append(self._queue.popleft())
+            except IndexError:
+                pass
+            for msg in self._coalesce_messages(batch):
                 self._handle_queue_message(msg)
-                processed += 1
-        except queue.Empty:
-            pass
         except Exception as e:
             # Critical: queue polling failed
             self._append_log(f"✗ Queue polling error: {type(e).__name__}: {e}")
-            import traceback
-            self._append_log(f"Traceback: {traceback.format_exc()}")
+            if self._debug_tracebacks:
+                self._append_log(f"Traceback: {traceback.format_exc()}")
         finally:
-            self._flush_log_buffer()
-            # Always reschedule polling to keep GUI responsive
+            # One Text insert per ~50 ms instead of one per log line
+            if (
+                self._pending_line_count > LOG_FLUSH_MAX_LINES
+                or time.monotonic() - self._last_log_flush >= LOG_FLUSH_INTERVAL
+            ):
+                self._flush_log_buffer()
+            # Always reschedule polling to keep GUI responsive; poll faster
+            # while work is arriving and back off when the queue is idle
+            delay = POLL_BUSY_MS if batch or self._pending_logs else POLL_IDLE_MS
             try:
-                self.root.after(100, self._poll_queue)
+                self.root.after(delay, self._poll_queue)
             except Exception:
                 # Even scheduling failed - this is very bad
                 pass
 
+    @staticmethod
+    def _coalesce_messages(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop status and download-progress updates superseded later in the batch.
+
+        Only the newest status text and the newest "downloading" payload per
+        file are applied, so a burst of yt-dlp ticks costs one widget update.
+        Logs, results and other messages are kept in their original order.
+        """
+        seen = set()
+        kept: List[Dict[str, Any]] = []
+        for msg in reversed(batch):
+            mtype = msg.get("type")
+            key: Any = None
+            if mtype == "status":
+                key = "status"
+            elif mtype == "progress":
+                payload = msg.get("payload") or {}
+                if payload.get("status") == "downloading":
+                    info_dict = payload.get("info_dict") or {}
+                    key = (
+                        "progress",
+                        payload.get("filename"),
+                        payload.get("playlist_index")
+                        or info_dict.get("playlist_index"),
+                    )
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(msg)
+        kept.reverse()
+        return kept
+
     def _handle_queue_message(self, msg: Dict[str, Any]) -> None:
         """Handle a single message from the queue."""
         try:
@@ -1466,6 +1754,18 @@ class App:
             if mtype == "log":
                 self._buffer_log(str(msg.get("text", "")))
 
+            elif mtype == "log_batch":
+                self._buffer_log("\n".join(msg.get("lines") or ()))
+
+            elif mtype == "log_exc":
+                # Formatted here so failing workers don't spend time on it
+                exc = msg.get("exc")
+                if self._debug_tracebacks and isinstance(exc, BaseException):
+                    tb = "".join(
+                        traceback.format_exception(type(exc), exc, exc.__traceback__)
+                    )
+                    self._buffer_log(f"Traceback: {tb}")
+
             elif mtype == "status":
                 self.status_var.set(str(msg.get("text", "")))
 
@@ -1487,7 +1787,8 @@ class App:
             elif mtype == "error":
                 # Critical worker error
                 error_msg = msg.get("message", "Unknown error")
-                self._append_log(f"✗ Critical error: {error_msg}")
+                self._buffer_log(f"✗ Critical error: {error_msg}")
+                self._flush_log_buffer()
                 self.status_var.set(f"Error: {error_msg}")
                 self._set_running(False)
                 messagebox.showerror(
@@ -1496,19 +1797,26 @@ class App:
                     "Check the log for more details."
                 )
             
+            elif mtype == "check_failed":
+                # Pre-flight FFmpeg/output folder check failed before downloading
+                self._flush_log_buffer()
+                self.status_var.set("Idle")
+                self._set_running(False)
+                messagebox.showerror(msg.get("title", "Error"), msg.get("message", "Unknown error"))
+
             elif mtype == "preview_ready":
                 # Preview data is ready - display it
                 self._display_preview_info(msg.get("url", ""), msg.get("info", {}))
             
             elif mtype == "preview_error":
                 # Preview operation failed - show error
+                self._flush_log_buffer()
                 messagebox.showerror(msg.get("title", "Error"), msg.get("message", "Unknown error"))
             
             elif mtype == "preview_complete":
                 # Preview operation finished - restore UI
                 self._is_previewing = False
-                self.progress.stop()
-                self.progress.configure(mode="determinate")
+                self._set_progress_mode("determinate")
                 self.progress["value"] = 0
                 self.status_var.set("Idle")
                 self.preview_btn.configure(state="normal")
@@ -1517,9 +1825,9 @@ class App:
                 
         except Exception as e:
             # Failsafe: if message handling itself fails
-            self._append_log(f"✗ Error handling queue message: {type(e).__name__}: {e}")
-            import traceback
-            self._append_log(f"Traceback: {traceback.format_exc()}")
+            self._buffer_log(f"✗ Error handling queue message: {type(e).__name__}: {e}")
+            if self._debug_tracebacks:
+                self._buffer_log(f"Traceback: {traceback.format_exc()}")
 
     def _handle_progress(self, payload: Dict[str, Any]) -> None:
         """Handle progress update messages."""
@@ -1574,51 +1882,67 @@ class App:
                 f"📋 Playlist: {current}/{total} (✓{successful} ⊘{skipped} ✗{failed})"
             )
             if title:
-                self._append_log(f"[{current}/{total}] {title}")
+                self._buffer_log(f"[{current}/{total}] {title}")
 
-            pct = (current / max(1, total)) * 100.0
-            self.progress.configure(mode="determinate")
-            self.progress["value"] = pct
+            if not self._run_parallel:
+                pct = current * 100.0 / total if total else 0.0
+                self._set_progress_mode("determinate")
+                self.progress["value"] = pct
             return
 
         # Update status text based on stage
-        stage_messages = {
-            "extracting": "⚙ Extracting video information...",
-            "downloading": "⬇ Downloading audio stream...",
-            "downloaded": "✓ Download complete",
-            "converting": f"♪ Converting to audio format...",
-            "metadata": "📝 Embedding metadata...",
-            "thumbnail": "🖼 Embedding thumbnail...",
-        }
+        stage_message = self._STAGE_MESSAGES.get(stage)
+        if stage_message:
+            self.status_var.set(stage_message)
 
-        if stage in stage_messages:
-            self.status_var.set(stage_messages[stage])
+        # Per-file byte progress from parallel URLs would make the bar jump
+        # between files; it follows the batch instead (_show_batch_progress)
+        if self._run_parallel:
+            return
 
         if status == "downloading":
             total = payload.get("total_bytes")
             downloaded = payload.get("downloaded_bytes")
             if isinstance(total, int) and total > 0 and isinstance(downloaded, int):
                 pct = max(0.0, min(100.0, (downloaded / total) * 100.0))
-                self.progress.configure(mode="determinate")
+                self._set_progress_mode("determinate")
                 self.progress["value"] = pct
             else:
                 # Unknown size
-                self.progress.configure(mode="indeterminate")
-                self.progress.start(10)
+                self._start_progress()
 
         elif status == "finished":
-            self.progress.stop()
-            self.progress.configure(mode="determinate")
+            self._set_progress_mode("determinate")
             self.progress["value"] = 100
 
         elif status == "processing":
             # Post-processing stages (conversion, metadata, thumbnail)
             message = payload.get("message", "Processing...")
-            self.progress.configure(mode="indeterminate")
-            self.progress.start(10)
+            self._start_progress()
 
         elif status == "error":
+            self._stop_progress()
+
+    def _set_progress_mode(self, mode: str) -> None:
+        """Switch the progress bar mode, stopping any animation for determinate."""
+        if mode == "determinate":
+            self._stop_progress()
+        if mode != self._progress_mode:
+            self.progress.configure(mode=mode)
+            self._progress_mode = mode
+
+    def _start_progress(self) -> None:
+        """Show the indeterminate animation for work of unknown size."""
+        self._set_progress_mode("indeterminate")
+        if not self._progress_running:
+            self.progress.start(10)
+            self._progress_running = True
+
+    def _stop_progress(self) -> None:
+        """Stop the indeterminate animation if it is running."""
+        if self._progress_running:
             self.progress.stop()
+            self._progress_running = False
 
     def _handle_playlist_progress(self, msg: Dict[str, Any]) -> None:
         """Handle playlist-specific progress updates."""
@@ -1628,72 +1952,112 @@ class App:
 
         self.status_var.set(f"📋 Playlist: {current}/{total}")
         if title:
-            self._append_log(f"  [{current}/{total}] {title}")
+            self._buffer_log(f"  [{current}/{total}] {title}")
+
+        if self._run_parallel:
+            url = msg.get("url")
+            if url and total:
+                self._url_progress[url] = min(1.0, current / total)
+            self._show_batch_progress()
+            return
 
-        pct = (current / max(1, total)) * 100.0
-        self.progress.configure(mode="determinate")
+        pct = current * 100.0 / total if total else 0.0
+        self._set_progress_mode("determinate")
         self.progress["value"] = pct
 
+    def _show_batch_progress(self) -> None:
+        """Show progress over the whole batch while several URLs run at once."""
+        done = self._run_completed + sum(self._url_progress.values())
+        self._set_progress_mode("determinate")
+        self.progress["value"] = done * 100.0 / max(1, self._run_total)
+
     def _handle_result(self, msg: Dict[str, Any]) -> None:
         """Handle download result messages."""
         try:
             result: downloader.DownloadResult = msg["result"]
             completed = int(msg.get("completed", 0))
         except (KeyError, ValueError, TypeError) as e:
-            self._append_log(f"✗ Error parsing result message: {e}")
+            self._buffer_log(f"✗ Error parsing result message: {e}")
             return
         total = int(msg.get("total", 1))
+        label = result.title or result.url
+        error_message = result.error_message
 
         if result.success:
             if result.skipped:
-                self._append_log(f"⊘ {result.title or result.url}")
-                self._append_log(f"  {result.error_message}")
+                self._buffer_log(f"⊘ {label}")
+                self._buffer_log(f"  {error_message}")
             else:
-                self._append_log(f"✓ {result.title or result.url}")
-                if result.output_path:
-                    self._append_log(f"  Saved: {result.output_path}")
+                self._buffer_log(f"✓ {label}")
+                output_path = result.output_path
+                if output_path:
+                    self._buffer_log(f"  Saved: {output_path}")
         else:
-            self._append_log(f"✗ {result.title or result.url}")
-            self._append_log(f"  Error: {result.error_message}")
-            self._run_errors.append(
-                {"url": result.url or "Unknown URL", "error": result.error_message}
-            )
+            self._buffer_log(f"✗ {label}")
+            self._buffer_log(f"  Error: {error_message}")
+            error_message = error_message or ""
+            signature = _ERR_SIG_RE.sub("#", error_message.lower())[:200]
+            self._run_error_total += 1
+            if signature in self._run_errors:
+                self._run_errors[signature] += 1
+            elif len(self._run_errors) < RUN_ERROR_MAX_GROUPS:
+                self._run_errors[signature] = 1
+                self._run_error_examples[signature] = (
+                    result.url or "Unknown URL",
+                    error_message,
+                )
+
+        self.status_var.set(f"Completed {completed}/{total}")
+        if self._run_parallel:
+            self._run_completed = completed
+            self._url_progress.pop(msg.get("url") or result.url, None)
+            self._show_batch_progress()
+            return
 
         # coarse overall progress (per-url)
         overall_pct = (completed / max(1, total)) * 100.0
-        if self.progress["mode"] != "indeterminate":
+        if self._progress_mode != "indeterminate":
             self.progress["value"] = overall_pct
-        self.status_var.set(f"Completed {completed}/{total}")
 
     def _handle_cancelled(self) -> None:
         """Handle cancellation messages."""
-        self.progress.stop()
+        self._stop_progress()
         self.status_var.set("Cancelled")
-        self._append_log("Cancelled.")
+        self._buffer_log("Cancelled.")
         self._run_cancelled = True
+        self._run_parallel = False
         self._set_running(False)
 
     def _handle_done(self) -> None:
         """Handle completion messages."""
-        self.progress.stop()
-        self.progress.configure(mode="determinate")
+        self._set_progress_mode("determinate")
         self.progress["value"] = 100
         self.status_var.set("Done")
-        self._append_log("All done.")
+        self._buffer_log("All done.")
+        self._flush_log_buffer()
+        self._run_parallel = False
         self._set_running(False)
         self._last_playlist_index = None
         if self._run_errors and not self._run_cancelled:
+            failed = self._run_error_total
             preview = []
-            for err in self._run_errors[:3]:
-                preview.append(f"{err['url']}\n  {err['error']}")
+            shown = 0
+            for signature, count in self._run_errors.most_common(3):
+                url, error = self._run_error_examples[signature]
+                preview.append(f"[{count}×] {url}\n  {error}")
+                shown += count
             extra = ""
             if len(self._run_errors) > 3:
-                extra = f"\n\n...and {len(self._run_errors) - 3} more error(s)."
-            messagebox.showwarning(
-                "Some downloads failed",
-                f"{len(self._run_errors)} URL(s) failed.\n\n"
-                + "\n\n".join(preview)
-                + extra,
+                extra = (
+                    f"\n\n...and {len(self._run_errors) - 3} more distinct error(s), "
+                    f"{failed - shown} more occurrence(s)."
+                )
+            body = f"{failed} URL(s) failed.\n\n" + "\n\n".join(preview) + extra
+            # Paint the final progress/status/log state in one pass, then show
+            # the modal dialog once this message batch has been handled
+            self.root.update_idletasks()
+            self.root.after_idle(
+                functools.partial(messagebox.showwarning, "Some downloads failed", body)
             )
 
 
@@ -1702,19 +2066,21 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="TubeTracks - Tkinter GUI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        # Exact flags only, so the membership test below can't miss "--vers"
+        allow_abbrev=False,
     )
+    # --help and argument errors exit inside parse_args(); of the early-exit
+    # paths only --version needs the backend (and yt-dlp) for its string
+    argv = set(sys.argv[1:])
+    version = _load_backend().__version__ if "--version" in argv else ""
     parser.add_argument(
         "--version",
         action="version",
-        version=f"tubetracks-gui {downloader.__version__}",
+        version=f"tubetracks-gui {version}",
     )
 
-    # Check for help/version before tkinter initialization (fixes CI/headless issues)
-    if "--help" in sys.argv or "-h" in sys.argv or "--version" in sys.argv:
-        parser.parse_args()
-        return
-
-    # Parse remaining args (currently none, but ready for future expansion)
+    # --help/--version print and exit here, before tkinter initialization
+    # (fixes CI/headless issues); no other options yet, but ready for expansion
     args = parser.parse_args()
 
     root = tk.Tk()
@@ -1722,19 +2088,38 @@ def main() -> None:
     # Improve default appearance on Windows
     try:
         style = ttk.Style(root)
-        if "vista" in style.theme_names():
+        themes = set(style.theme_names())
+        if "vista" in themes:
             style.theme_use("vista")
-        elif "clam" in style.theme_names():
+        elif "clam" in themes:
             style.theme_use("clam")
     except Exception:
         pass
 
-    App(root)
+    app = App(root)
     try:
         root.mainloop()
     except KeyboardInterrupt:
         pass  # Gracefully handle Ctrl+C
 
+    # Pool threads are not daemon threads and are joined at interpreter exit;
+    # cancel them cooperatively and wait here so the exit stays bounded
+    app._stop_workers()
+    if not app._wait_for_workers(EXIT_GRACE_SECONDS):
+        # Only a preview stuck on the network gets here; it writes no files
+        alive = ", ".join(
+            thread.name
+            for thread in threading.enumerate()
+            if thread is not threading.main_thread() and not thread.daemon
+        )
+        print(
+            f"tubetracks-gui: preview did not stop within {EXIT_GRACE_SECONDS:g}s; "
+            f"exiting with threads still running: {alive}",
+            file=sys.stderr,
+            flush=True,
+        )
+        os._exit(1)
+
 
 if __name__ == "__main__":
     main()